@@ -3,6 +3,7 @@ Contract Analysis & Risk Assessment Bot
 Main Streamlit Application
 """
 import streamlit as st
+import hashlib
 import sys
 from pathlib import Path
 
@@ -16,8 +17,8 @@ from src.nlp_engine import (
     EntityExtractor, ObligationAnalyzer, AmbiguityDetector
 )
 from src.risk_engine import (
-    RiskScorer, ClauseDetectors, 
-    ComplianceChecker, RiskReportGenerator
+    ClauseDetectors, ComplianceChecker,
+    RiskReportGenerator, get_default_scorer
 )
 from src.llm_integration import (
     LLMClient, ClauseExplainer, 
@@ -75,6 +76,10 @@ def initialize_session_state():
         st.session_state.analysis_results = None
     if "uploaded_file_name" not in st.session_state:
         st.session_state.uploaded_file_name = None
+    if "clause_index" not in st.session_state:
+        st.session_state.clause_index = None
+    if "pdf_report" not in st.session_state:
+        st.session_state.pdf_report = None
 
 
 def render_sidebar():
@@ -104,6 +109,49 @@ def render_sidebar():
     UIComponents.render_sidebar_info()
 
 
+@st.cache_resource(show_spinner=False)
+def get_obligation_analyzer() -> ObligationAnalyzer:
+    """Analyzer shared across reruns and sessions so its result cache is reused"""
+    return ObligationAnalyzer()
+
+
+@st.cache_resource(show_spinner=False)
+def get_clause_detectors() -> ClauseDetectors:
+    """Detectors shared across reruns and sessions so their result cache is reused"""
+    return ClauseDetectors()
+
+
+@st.cache_resource(show_spinner=False)
+def get_compliance_checker() -> ComplianceChecker:
+    """Checker shared across reruns and sessions so its result cache is reused"""
+    return ComplianceChecker()
+
+
+def hash_clauses(clauses: list) -> str:
+    """
+    Hash a clause list for the scoring cache
+    
+    Each field is length-prefixed, so different segmentations of the same
+    text get different keys; the heading and number are included because
+    they are copied into the clause scores.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(len(clauses).to_bytes(8, "little"))
+    for clause in clauses:
+        for field in ("clause_number", "heading", "text"):
+            data = str(clause.get(field, "")).encode()
+            digest.update(len(data).to_bytes(8, "little"))
+            digest.update(data)
+    return digest.hexdigest()
+
+
+@st.cache_data(show_spinner=False, max_entries=16)
+def score_clauses(text_hash: str, _clauses: list) -> tuple:
+    """Score clauses once per distinct document, keyed by its content hash"""
+    risk_score = get_default_scorer().score_contract(_clauses)
+    return risk_score["clause_scores"], risk_score
+
+
 def analyze_contract(file_bytes: bytes, file_name: str) -> dict:
     """Run full contract analysis pipeline"""
     results = {
@@ -145,7 +193,7 @@ def analyze_contract(file_bytes: bytes, file_name: str) -> dict:
         
         # Step 5: Obligation Analysis
         progress_bar.progress(50, text="⚖️ Analyzing obligations...")
-        obligation_analyzer = ObligationAnalyzer()
+        obligation_analyzer = get_obligation_analyzer()
         results["obligations"] = obligation_analyzer.analyze(text)
         
         # Step 6: Ambiguity Detection
@@ -155,12 +203,11 @@ def analyze_contract(file_bytes: bytes, file_name: str) -> dict:
         
         # Step 7: Risk Scoring
         progress_bar.progress(65, text="📊 Calculating risk scores...")
-        risk_scorer = RiskScorer()
+        clause_scores, results["risk_score"] = score_clauses(hash_clauses(clauses), clauses)
         
-        # Score individual clauses
+        # Merge clause scores into the extracted clauses
         scored_clauses = []
-        for clause in clauses:
-            clause_score = risk_scorer.score_clause(clause.get("text", ""))
+        for clause, clause_score in zip(clauses, clause_scores):
             scored_clauses.append({
                 **clause,
                 "score": clause_score["score"],
@@ -169,16 +216,15 @@ def analyze_contract(file_bytes: bytes, file_name: str) -> dict:
             })
         
         results["clauses"] = scored_clauses
-        results["risk_score"] = risk_scorer.score_contract(clauses)
         
         # Step 8: Clause Detection
         progress_bar.progress(75, text="🔴 Detecting risky clauses...")
-        clause_detectors = ClauseDetectors()
+        clause_detectors = get_clause_detectors()
         results["clause_detections"] = clause_detectors.detect_all(text)
         
         # Step 9: Compliance Check
         progress_bar.progress(80, text="✓ Checking compliance...")
-        compliance_checker = ComplianceChecker()
+        compliance_checker = get_compliance_checker()
         contract_type = results["contract_type"].get("primary_type", "general")
         results["compliance"] = compliance_checker.check_compliance(text, contract_type)
         
@@ -261,6 +307,10 @@ def render_upload_section():
                     st.session_state.analysis_results = results
                     st.session_state.analysis_complete = True
                     st.session_state.uploaded_file_name = uploaded_file.name
+                    st.session_state.clause_index = Dashboard.index_clauses_by_level(
+                        results.get("clauses", [])
+                    )
+                    st.session_state.pdf_report = None
                     st.rerun()
 
 
@@ -279,9 +329,13 @@ def render_results_section():
         st.markdown(f"## 📋 Analysis: {st.session_state.uploaded_file_name}")
     
     with col2:
-        # Export PDF button
-        pdf_gen = PDFReportGenerator()
-        pdf_bytes = pdf_gen.generate(results, st.session_state.uploaded_file_name)
+        # Export PDF button; the report is built once per analysis, not on
+        # every rerun
+        pdf_bytes = st.session_state.pdf_report
+        if pdf_bytes is None:
+            pdf_gen = PDFReportGenerator()
+            pdf_bytes = pdf_gen.generate(results, st.session_state.uploaded_file_name)
+            st.session_state.pdf_report = pdf_bytes
         st.download_button(
             "📥 Download PDF Report",
             data=pdf_bytes,
@@ -294,6 +348,8 @@ def render_results_section():
             st.session_state.analysis_complete = False
             st.session_state.analysis_results = None
             st.session_state.uploaded_file_name = None
+            st.session_state.clause_index = None
+            st.session_state.pdf_report = None
             st.rerun()
     
     # Render dashboard
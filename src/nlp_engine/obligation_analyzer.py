@@ -2,8 +2,33 @@
 Obligation Analyzer
 Identifies obligations, rights, and prohibitions in contract clauses
 """
+import hashlib
+import pickle
 import re
-from typing import Dict, List, Tuple
+import threading
+import sys
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+# Number of recent analyze results kept for repeated analysis of the same text
+_CACHE_SIZE = 8
+
+# Statement types shared by every classification result
+_OBLIGATION = sys.intern("obligation")
+_RIGHT = sys.intern("right")
+_PROHIBITION = sys.intern("prohibition")
+_NEUTRAL = sys.intern("neutral")
+_UNSPECIFIED = sys.intern("unspecified")
+
+
+class Classification(NamedTuple):
+    """Lightweight result of classifying a single sentence"""
+    type: str
+    strength: Optional[str]
+    markers: Tuple[str, ...]
+    affected_party: str
+
+
+_NEUTRAL_CLASSIFICATION = Classification(_NEUTRAL, None, (), sys.intern("unknown"))
 
 
 class ObligationAnalyzer:
@@ -41,49 +66,67 @@ class ObligationAnalyzer:
                             "lessee", "tenant", "client", "customer", "licensee"],
             "both_parties": ["both parties", "either party", "each party", "parties"]
         }
+        
+        # Intern the constant strings so every result shares the same objects
+        self.markers = {
+            sys.intern(statement_type): {
+                sys.intern(strength): [sys.intern(m) for m in markers]
+                for strength, markers in strengths.items()
+            }
+            for statement_type, strengths in self.markers.items()
+        }
+        self.party_roles = {
+            sys.intern(role): [sys.intern(i) for i in indicators]
+            for role, indicators in self.party_roles.items()
+        }
+        
+        # Recent analyze results keyed by text digest, oldest first; the lock
+        # lets one instance be shared between sessions
+        self._cache: Dict[bytes, bytes] = {}
+        self._cache_lock = threading.Lock()
     
     def analyze(self, text: str) -> Dict:
         """
         Analyze text to extract obligations, rights, and prohibitions
         
+        Results for the last few distinct texts are cached; each call
+        returns its own copy, safe for the caller to modify.
+        
         Args:
             text: Contract clause or full contract text
             
         Returns:
             Dict with categorized statements
         """
+        key = hashlib.blake2b(text.encode(), digest_size=16).digest()
+        with self._cache_lock:
+            cached = self._cache.get(key)
+        if cached is not None:
+            return pickle.loads(cached)
+        
         sentences = self._split_sentences(text)
         
         obligations = []
         rights = []
         prohibitions = []
+        strong_obl = excl_rights = 0
         
         for sentence in sentences:
             classification = self._classify_sentence(sentence)
+            statement_type = classification.type
             
-            if classification["type"] == "obligation":
-                obligations.append({
-                    "text": sentence,
-                    "strength": classification["strength"],
-                    "affected_party": classification["affected_party"],
-                    "markers_found": classification["markers"]
-                })
-            elif classification["type"] == "right":
-                rights.append({
-                    "text": sentence,
-                    "strength": classification["strength"],
-                    "affected_party": classification["affected_party"],
-                    "markers_found": classification["markers"]
-                })
-            elif classification["type"] == "prohibition":
-                prohibitions.append({
-                    "text": sentence,
-                    "strength": classification["strength"],
-                    "affected_party": classification["affected_party"],
-                    "markers_found": classification["markers"]
-                })
+            if statement_type == _OBLIGATION:
+                if classification.strength == "strong":
+                    strong_obl += 1
+                obligations.append(self._to_record(sentence, classification))
+            elif statement_type == _RIGHT:
+                if classification.strength == "exclusive":
+                    excl_rights += 1
+                rights.append(self._to_record(sentence, classification))
+            elif statement_type == _PROHIBITION:
+                prohibitions.append(self._to_record(sentence, classification))
         
-        return {
+        result = {
             "obligations": obligations,
             "rights": rights,
             "prohibitions": prohibitions,
@@ -91,10 +134,24 @@ class ObligationAnalyzer:
                 "total_obligations": len(obligations),
                 "total_rights": len(rights),
                 "total_prohibitions": len(prohibitions),
-                "strong_obligations": len([o for o in obligations if o["strength"] == "strong"]),
-                "exclusive_rights": len([r for r in rights if r["strength"] == "exclusive"])
+                "strong_obligations": strong_obl,
+                "exclusive_rights": excl_rights
             }
         }
+        
+        # Cached pickled: serialising is far cheaper than a deep copy on this
+        # common miss path, and each hit unpickles a private copy
+        frozen = pickle.dumps(result, pickle.HIGHEST_PROTOCOL)
+        with self._cache_lock:
+            if len(self._cache) >= _CACHE_SIZE:
+                self._cache.pop(next(iter(self._cache)), None)
+            self._cache[key] = frozen
+        return result
+    
+    def clear_cache(self):
+        """Drop all cached analyze results"""
+        with self._cache_lock:
+            self._cache.clear()
     
     def _split_sentences(self, text: str) -> List[str]:
         """Split text into sentences"""
@@ -110,49 +167,34 @@ class ObligationAnalyzer:
         # Filter empty and very short sentences
         return [s.strip() for s in sentences if len(s.strip()) > 20]
     
-    def _classify_sentence(self, sentence: str) -> Dict:
+    def _classify_sentence(self, sentence: str) -> Classification:
         """Classify a sentence as obligation, right, or prohibition"""
         sentence_lower = sentence.lower()
         
-        # Check for prohibitions first (they often contain obligation markers too)
-        for strength, markers in self.markers["prohibition"].items():
-            for marker in markers:
-                if marker in sentence_lower:
-                    return {
-                        "type": "prohibition",
-                        "strength": strength,
-                        "markers": [marker],
-                        "affected_party": self._identify_affected_party(sentence)
-                    }
-        
-        # Check for obligations
-        for strength, markers in self.markers["obligation"].items():
-            for marker in markers:
-                if marker in sentence_lower:
-                    return {
-                        "type": "obligation",
-                        "strength": strength,
-                        "markers": [marker],
-                        "affected_party": self._identify_affected_party(sentence)
-                    }
-        
-        # Check for rights
-        for strength, markers in self.markers["right"].items():
-            for marker in markers:
-                if marker in sentence_lower:
-                    return {
-                        "type": "right",
-                        "strength": strength,
-                        "markers": [marker],
-                        "affected_party": self._identify_affected_party(sentence)
-                    }
+        # Check prohibitions first (they often contain obligation markers too),
+        # then obligations, then rights
+        for statement_type in (_PROHIBITION, _OBLIGATION, _RIGHT):
+            for strength, markers in self.markers[statement_type].items():
+                for marker in markers:
+                    if marker in sentence_lower:
+                        return Classification(
+                            statement_type,
+                            strength,
+                            (marker,),
+                            self._identify_affected_party(sentence)
+                        )
         
         # No clear classification
+        return _NEUTRAL_CLASSIFICATION
+    
+    @staticmethod
+    def _to_record(sentence: str, classification: Classification) -> Dict:
+        """Convert a classification into the public statement dict"""
         return {
-            "type": "neutral",
-            "strength": None,
-            "markers": [],
-            "affected_party": "unknown"
+            "text": sentence,
+            "strength": classification.strength,
+            "affected_party": classification.affected_party,
+            "markers_found": list(classification.markers)
         }
     
     def _identify_affected_party(self, sentence: str) -> str:
@@ -164,7 +206,7 @@ class ObligationAnalyzer:
                 if indicator in sentence_lower:
                     return role
         
-        return "unspecified"
+        return _UNSPECIFIED
     
     def get_one_sided_terms(self, analysis_result: Dict) -> Dict:
         """
@@ -179,29 +221,33 @@ class ObligationAnalyzer:
             "concerns": []
         }
         
+        first_party_favored = one_sided["first_party_favored"]
+        concerns = one_sided["concerns"]
+        
         # Check for exclusive rights
         for right in analysis_result.get("rights", []):
-            if right["strength"] == "exclusive":
-                if right["affected_party"] == "first_party":
-                    one_sided["first_party_favored"].append({
-                        "type": "exclusive_right",
-                        "text": right["text"]
-                    })
-                    one_sided["concerns"].append(
-                        f"Exclusive right favoring first party: {right['text'][:100]}..."
-                    )
+            strength, party = right["strength"], right["affected_party"]
+            if strength == "exclusive" and party == "first_party":
+                text = right["text"]
+                first_party_favored.append({
+                    "type": "exclusive_right",
+                    "text": text
+                })
+                concerns.append(
+                    f"Exclusive right favoring first party: {text[:100]}..."
+                )
         
         # Check for strong prohibitions
         for prohibition in analysis_result.get("prohibitions", []):
-            if prohibition["strength"] == "strong":
-                if prohibition["affected_party"] == "second_party":
-                    one_sided["first_party_favored"].append({
-                        "type": "strong_prohibition",
-                        "text": prohibition["text"]
-                    })
+            strength, party = prohibition["strength"], prohibition["affected_party"]
+            if strength == "strong" and party == "second_party":
+                first_party_favored.append({
+                    "type": "strong_prohibition",
+                    "text": prohibition["text"]
+                })
         
         # Calculate balance score
-        first_party_score = len(one_sided["first_party_favored"])
+        first_party_score = len(first_party_favored)
         second_party_score = len(one_sided["second_party_favored"])
         
         if first_party_score > second_party_score + 3:
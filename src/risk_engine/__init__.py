@@ -2,13 +2,15 @@
 Risk Assessment Engine
 Evaluates contract risks and compliance
 """
-from .risk_scorer import RiskScorer
+from .risk_scorer import RiskScorer, ScoringRun, get_default_scorer
 from .clause_detectors import ClauseDetectors
 from .compliance_checker import ComplianceChecker
 from .risk_report import RiskReportGenerator
 
 __all__ = [
     "RiskScorer",
+    "ScoringRun",
+    "get_default_scorer",
     "ClauseDetectors",
     "ComplianceChecker",
     "RiskReportGenerator"
@@ -2,24 +2,134 @@
 Clause Detectors
 Specialized detectors for specific risky clause types
 """
+import hashlib
+import pickle
 import re
+import threading
 from typing import Dict, List, Optional
 
 
+# Number of recent detect_all results kept for repeated analysis of the same text
+_CACHE_SIZE = 8
+
+
+def _compile_all(patterns: List[str]) -> List[re.Pattern]:
+    """Compile detector patterns once, case-insensitively"""
+    return [re.compile(pattern, re.IGNORECASE) for pattern in patterns]
+
+
 class ClauseDetectors:
     """Detection of specific clause types that may pose risks"""
     
+    # Penalty and liquidated damages patterns
+    PENALTY_PATTERNS = _compile_all([
+        r"penalty\s+(?:of|amounting\s+to)\s+(?:Rs\.?|INR|₹)?\s*[\d,]+",
+        r"liquidated\s+damages?\s+(?:of|amounting\s+to|equal\s+to)",
+        r"forfeit(?:ure)?\s+of\s+(?:deposit|advance|amount)",
+        r"damages?\s+(?:of|equal\s+to)\s+(?:\d+%|\d+\s+times)",
+    ])
+    
+    # Indemnification patterns
+    INDEMNITY_PATTERNS = _compile_all([
+        r"indemnif(?:y|ication|ies)\s+(?:and\s+)?(?:hold\s+harmless)?",
+        r"hold\s+harmless\s+(?:and\s+)?indemnif",
+        r"defend,?\s+indemnif(?:y|ication)",
+    ])
+    
+    # Arbitration and dispute resolution patterns
+    ARBITRATION_PATTERNS = _compile_all([
+        r"arbitration\s+(?:clause|proceedings?|shall\s+be)",
+        r"submit(?:ted)?\s+to\s+arbitration",
+        r"(?:SIAC|ICC|LCIA|AAA)\s+(?:rules|arbitration)",
+        r"Arbitration\s+and\s+Conciliation\s+Act",
+        r"seat\s+of\s+(?:the\s+)?arbitration",
+    ])
+    
+    # Automatic renewal and lock-in patterns
+    AUTO_RENEWAL_PATTERNS = _compile_all([
+        r"automatic(?:ally)?\s+renew(?:al|ed)?",
+        r"auto-?renew(?:al)?",
+        r"renew(?:ed)?\s+automatically",
+        r"lock-?in\s+period\s+of\s+\d+",
+        r"minimum\s+(?:term|period|commitment)\s+of\s+\d+",
+    ])
+    
+    # Non-compete and restrictive covenant patterns
+    NON_COMPETE_PATTERNS = _compile_all([
+        r"non-?compete(?:tion)?\s+(?:clause|covenant|agreement|restriction)?",
+        r"restrictive\s+covenant",
+        r"shall\s+not\s+(?:directly\s+or\s+indirectly\s+)?(?:engage|compete|work|provide\s+services)",
+        r"restraint\s+(?:of\s+)?trade",
+    ])
+    
+    # Intellectual property transfer patterns
+    IP_TRANSFER_PATTERNS = _compile_all([
+        r"(?:transfer|assign(?:ment)?|convey)\s+(?:of\s+)?(?:all\s+)?intellectual\s+property",
+        r"intellectual\s+property\s+(?:rights?\s+)?(?:shall\s+)?(?:belong|vest)\s+(?:in|with)",
+        r"work\s+(?:made\s+)?for\s+hire",
+        r"assign\s+all\s+(?:right,?\s+title,?\s+and\s+interest)",
+        r"(?:copyright|patent|trademark)\s+(?:shall\s+)?(?:belong|vest)",
+    ])
+    
+    # Confidentiality and NDA patterns
+    CONFIDENTIALITY_PATTERNS = _compile_all([
+        r"confidential(?:ity)?\s+(?:information|agreement|obligation|clause)",
+        r"non-?disclosure\s+(?:agreement|obligation)",
+        r"proprietary\s+information",
+        r"trade\s+secret",
+    ])
+    
+    # Limitation of liability patterns
+    LIABILITY_CAP_PATTERNS = _compile_all([
+        r"limitation\s+(?:of\s+)?liability",
+        r"(?:aggregate|total|maximum)\s+liability\s+(?:shall\s+)?(?:not\s+)?exceed",
+        r"liability\s+(?:shall\s+be\s+)?limited\s+to",
+        r"cap(?:ped)?\s+(?:at|to)\s+(?:Rs\.?|INR|₹|\$)?\s*[\d,]+",
+    ])
+    
+    # Termination patterns grouped by the kind of termination right they signal
+    TERMINATION_PATTERNS = {
+        "unilateral": _compile_all([
+            r"(?:party|company|employer)\s+may\s+terminate\s+(?:this\s+)?(?:agreement|contract)\s+(?:at\s+)?(?:any\s+time|without\s+cause)",
+            r"terminate\s+(?:immediately|without\s+notice|with\s+immediate\s+effect)",
+            r"sole\s+discretion\s+to\s+terminate",
+        ]),
+        "mutual": _compile_all([
+            r"either\s+party\s+may\s+terminate",
+            r"mutual\s+(?:agreement|consent)\s+to\s+terminate",
+            r"both\s+parties\s+(?:may|agree\s+to)\s+terminate",
+        ]),
+        "for_cause": _compile_all([
+            r"terminate\s+(?:for\s+)?(?:cause|breach|default)",
+            r"material\s+breach.*terminate",
+            r"cure\s+period\s+of\s+\d+\s+days",
+        ]),
+    }
+    
     def __init__(self):
-        pass
+        # Recent detect_all results keyed by text digest, oldest first; the lock
+        # lets one instance be shared between sessions
+        self._cache: Dict[bytes, bytes] = {}
+        self._cache_lock = threading.Lock()
     
     def detect_all(self, text: str) -> Dict:
         """
         Run all clause detectors on the text
         
+        Results for the last few distinct texts are cached, so re-analysing
+        the same contract returns the previous result without rescanning.
+        Each call returns its own copy, safe for the caller to modify.
+        
         Returns:
             Dict with all detection results
         """
-        return {
+        key = hashlib.blake2b(text.encode(), digest_size=16).digest()
+        with self._cache_lock:
+            cached = self._cache.get(key)
+        if cached is not None:
+            return pickle.loads(cached)
+        
+        result = {
             "penalty_clauses": self.detect_penalty_clauses(text),
             "indemnity_clauses": self.detect_indemnity_clauses(text),
             "termination_clauses": self.detect_termination_clauses(text),
@@ -30,19 +140,26 @@ class ClauseDetectors:
             "confidentiality_clauses": self.detect_confidentiality(text),
             "liability_caps": self.detect_liability_caps(text),
         }
+        
+        # Keep a pickle, not the live dict: a single analysis per upload then
+        # pays little for caching, and hits still get their own objects
+        frozen = pickle.dumps(result, pickle.HIGHEST_PROTOCOL)
+        with self._cache_lock:
+            if len(self._cache) >= _CACHE_SIZE:
+                self._cache.pop(next(iter(self._cache)), None)
+            self._cache[key] = frozen
+        return result
+    
+    def clear_cache(self):
+        """Drop all cached detect_all results"""
+        with self._cache_lock:
+            self._cache.clear()
     
     def detect_penalty_clauses(self, text: str) -> Dict:
         """Detect penalty and liquidated damages clauses"""
-        patterns = [
-            r"penalty\s+(?:of|amounting\s+to)\s+(?:Rs\.?|INR|₹)?\s*[\d,]+",
-            r"liquidated\s+damages?\s+(?:of|amounting\s+to|equal\s+to)",
-            r"forfeit(?:ure)?\s+of\s+(?:deposit|advance|amount)",
-            r"damages?\s+(?:of|equal\s+to)\s+(?:\d+%|\d+\s+times)",
-        ]
-        
         findings = []
-        for pattern in patterns:
-            matches = list(re.finditer(pattern, text, re.IGNORECASE))
+        for pattern in self.PENALTY_PATTERNS:
+            matches = pattern.finditer(text)
             for match in matches:
                 context = self._get_context(text, match.start(), match.end())
                 
@@ -67,12 +184,6 @@ class ClauseDetectors:
     
     def detect_indemnity_clauses(self, text: str) -> Dict:
         """Detect indemnification clauses and assess their scope"""
-        patterns = [
-            r"indemnif(?:y|ication|ies)\s+(?:and\s+)?(?:hold\s+harmless)?",
-            r"hold\s+harmless\s+(?:and\s+)?indemnif",
-            r"defend,?\s+indemnif(?:y|ication)",
-        ]
-        
         scope_indicators = {
             "broad": [
                 r"all\s+claims",
@@ -92,8 +203,8 @@ class ClauseDetectors:
         findings = []
         text_lower = text.lower()
         
-        for pattern in patterns:
-            matches = list(re.finditer(pattern, text, re.IGNORECASE))
+        for pattern in self.INDEMNITY_PATTERNS:
+            matches = pattern.finditer(text)
             for match in matches:
                 context = self._get_context(text, match.start(), match.end(), window=200)
                 
@@ -126,34 +237,14 @@ class ClauseDetectors:
     
     def detect_termination_clauses(self, text: str) -> Dict:
         """Detect termination clauses and assess fairness"""
-        patterns = {
-            "unilateral": [
-                r"(?:party|company|employer)\s+may\s+terminate\s+(?:this\s+)?(?:agreement|contract)\s+(?:at\s+)?(?:any\s+time|without\s+cause)",
-                r"terminate\s+(?:immediately|without\s+notice|with\s+immediate\s+effect)",
-                r"sole\s+discretion\s+to\s+terminate",
-            ],
-            "mutual": [
-                r"either\s+party\s+may\s+terminate",
-                r"mutual\s+(?:agreement|consent)\s+to\s+terminate",
-                r"both\s+parties\s+(?:may|agree\s+to)\s+terminate",
-            ],
-            "for_cause": [
-                r"terminate\s+(?:for\s+)?(?:cause|breach|default)",
-                r"material\s+breach.*terminate",
-                r"cure\s+period\s+of\s+\d+\s+days",
-            ]
-        }
+        findings = {term_type: [] for term_type in self.TERMINATION_PATTERNS}
         
-        findings = {
-            "unilateral": [],
-            "mutual": [],
-            "for_cause": []
-        }
-        
-        for term_type, type_patterns in patterns.items():
+        # Each pattern is scanned on its own: in a single alternation the
+        # greedy ``material\s+breach.*terminate`` would swallow the rest of
+        # the line and hide overlapping unilateral or mutual matches
+        for term_type, type_patterns in self.TERMINATION_PATTERNS.items():
             for pattern in type_patterns:
-                matches = list(re.finditer(pattern, text, re.IGNORECASE))
-                for match in matches:
+                for match in pattern.finditer(text):
                     context = self._get_context(text, match.start(), match.end(), window=150)
                     
                     # Extract notice period if mentioned
@@ -183,17 +274,9 @@ class ClauseDetectors:
     
     def detect_arbitration_clauses(self, text: str) -> Dict:
         """Detect arbitration and dispute resolution clauses"""
-        patterns = [
-            r"arbitration\s+(?:clause|proceedings?|shall\s+be)",
-            r"submit(?:ted)?\s+to\s+arbitration",
-            r"(?:SIAC|ICC|LCIA|AAA)\s+(?:rules|arbitration)",
-            r"Arbitration\s+and\s+Conciliation\s+Act",
-            r"seat\s+of\s+(?:the\s+)?arbitration",
-        ]
-        
         findings = []
-        for pattern in patterns:
-            matches = list(re.finditer(pattern, text, re.IGNORECASE))
+        for pattern in self.ARBITRATION_PATTERNS:
+            matches = pattern.finditer(text)
             for match in matches:
                 context = self._get_context(text, match.start(), match.end(), window=200)
                 
@@ -221,17 +304,9 @@ class ClauseDetectors:
     
     def detect_auto_renewal(self, text: str) -> Dict:
         """Detect automatic renewal and lock-in clauses"""
-        patterns = [
-            r"automatic(?:ally)?\s+renew(?:al|ed)?",
-            r"auto-?renew(?:al)?",
-            r"renew(?:ed)?\s+automatically",
-            r"lock-?in\s+period\s+of\s+\d+",
-            r"minimum\s+(?:term|period|commitment)\s+of\s+\d+",
-        ]
-        
         findings = []
-        for pattern in patterns:
-            matches = list(re.finditer(pattern, text, re.IGNORECASE))
+        for pattern in self.AUTO_RENEWAL_PATTERNS:
+            matches = pattern.finditer(text)
             for match in matches:
                 context = self._get_context(text, match.start(), match.end(), window=150)
                 
@@ -260,16 +335,9 @@ class ClauseDetectors:
     
     def detect_non_compete(self, text: str) -> Dict:
         """Detect non-compete and restrictive covenant clauses"""
-        patterns = [
-            r"non-?compete(?:tion)?\s+(?:clause|covenant|agreement|restriction)?",
-            r"restrictive\s+covenant",
-            r"shall\s+not\s+(?:directly\s+or\s+indirectly\s+)?(?:engage|compete|work|provide\s+services)",
-            r"restraint\s+(?:of\s+)?trade",
-        ]
-        
         findings = []
-        for pattern in patterns:
-            matches = list(re.finditer(pattern, text, re.IGNORECASE))
+        for pattern in self.NON_COMPETE_PATTERNS:
+            matches = pattern.finditer(text)
             for match in matches:
                 context = self._get_context(text, match.start(), match.end(), window=200)
                 
@@ -298,17 +366,9 @@ class ClauseDetectors:
     
     def detect_ip_transfer(self, text: str) -> Dict:
         """Detect intellectual property transfer clauses"""
-        patterns = [
-            r"(?:transfer|assign(?:ment)?|convey)\s+(?:of\s+)?(?:all\s+)?intellectual\s+property",
-            r"intellectual\s+property\s+(?:rights?\s+)?(?:shall\s+)?(?:belong|vest)\s+(?:in|with)",
-            r"work\s+(?:made\s+)?for\s+hire",
-            r"assign\s+all\s+(?:right,?\s+title,?\s+and\s+interest)",
-            r"(?:copyright|patent|trademark)\s+(?:shall\s+)?(?:belong|vest)",
-        ]
-        
         findings = []
-        for pattern in patterns:
-            matches = list(re.finditer(pattern, text, re.IGNORECASE))
+        for pattern in self.IP_TRANSFER_PATTERNS:
+            matches = pattern.finditer(text)
             for match in matches:
                 context = self._get_context(text, match.start(), match.end(), window=200)
                 
@@ -332,16 +392,9 @@ class ClauseDetectors:
     
     def detect_confidentiality(self, text: str) -> Dict:
         """Detect confidentiality and NDA clauses"""
-        patterns = [
-            r"confidential(?:ity)?\s+(?:information|agreement|obligation|clause)",
-            r"non-?disclosure\s+(?:agreement|obligation)",
-            r"proprietary\s+information",
-            r"trade\s+secret",
-        ]
-        
         findings = []
-        for pattern in patterns:
-            matches = list(re.finditer(pattern, text, re.IGNORECASE))
+        for pattern in self.CONFIDENTIALITY_PATTERNS:
+            matches = pattern.finditer(text)
             for match in matches:
                 context = self._get_context(text, match.start(), match.end(), window=200)
                 
@@ -364,16 +417,9 @@ class ClauseDetectors:
     
     def detect_liability_caps(self, text: str) -> Dict:
         """Detect limitation of liability clauses"""
-        patterns = [
-            r"limitation\s+(?:of\s+)?liability",
-            r"(?:aggregate|total|maximum)\s+liability\s+(?:shall\s+)?(?:not\s+)?exceed",
-            r"liability\s+(?:shall\s+be\s+)?limited\s+to",
-            r"cap(?:ped)?\s+(?:at|to)\s+(?:Rs\.?|INR|₹|\$)?\s*[\d,]+",
-        ]
-        
         findings = []
-        for pattern in patterns:
-            matches = list(re.finditer(pattern, text, re.IGNORECASE))
+        for pattern in self.LIABILITY_CAP_PATTERNS:
+            matches = pattern.finditer(text)
             for match in matches:
                 context = self._get_context(text, match.start(), match.end(), window=200)
                 
@@ -2,126 +2,304 @@
 Compliance Checker
 Checks contract compliance with Indian business law requirements
 """
+import hashlib
+import pickle
+import os
 import re
-from typing import Dict, List
+import threading
+from itertools import chain
+from types import MappingProxyType
+from typing import Dict, List, NamedTuple, Tuple
+
+try:
+    import re2
+    RE2_AVAILABLE = True
+except ImportError:
+    RE2_AVAILABLE = False
+
+# Regex backend for compliance patterns. RE2 matches in linear time with no
+# backtracking, but its \s and \d are ASCII-only, so results would differ
+# from the stdlib engine on text with NBSP or other Unicode whitespace; it is
+# therefore only used when installed and COMPLIANCE_USE_RE2=true
+USE_RE2 = RE2_AVAILABLE and os.getenv("COMPLIANCE_USE_RE2", "false").lower() == "true"
+_RE = re2 if USE_RE2 else re
+
+# Matches kept per compliance check
+MAX_MATCHES = 5
+
+# Number of recent check_compliance results kept for repeated analysis
+_CACHE_SIZE = 32
+
+# Compliance status by minimum score, checked from the top down
+_STATUS_LADDER = (
+    (80, "[GOOD] Good Compliance - Contract addresses most legal requirements"),
+    (60, "[MODERATE] Moderate Compliance - Some requirements may need attention"),
+    (float("-inf"), "[LOW] Low Compliance - Several legal requirements may not be addressed"),
+)
+
+# Lease duration probe used to decide whether registration is mandatory
+_DURATION_RE = re.compile(r'(\d+)\s*(month|year)s?')
+
+
+class _CheckColumns(NamedTuple):
+    """Parallel per-check columns for one compliance section"""
+    order: Tuple[str, ...]
+    names: Tuple[str, ...]
+    descriptions: Tuple[str, ...]
+    patterns: Tuple[Tuple, ...]
+    manual_names: Tuple[str, ...]
+    manual_descriptions: Tuple[str, ...]
+
+
+# Indian Contract Act 1872 requirements
+_BASIC_REQUIREMENTS = {
+    "parties": {
+        "description": "Contract must clearly identify all parties",
+        "patterns": [
+            r"(?:between|party|parties)",
+            r"(?:first\s+party|second\s+party)",
+            r"(?:company|employer|employee|vendor|client)"
+        ]
+    },
+    "consideration": {
+        "description": "Contract must have lawful consideration",
+        "patterns": [
+            r"(?:consideration|payment|compensation|fee|salary|price)",
+            r"(?:rs\.?|inr|₹)\s*[\d,]+"
+        ]
+    },
+    "lawful_object": {
+        "description": "Contract object must be lawful"
+    },
+    "free_consent": {
+        "description": "Contract requires free consent of parties",
+        "warning_patterns": [
+            r"(?:coercion|undue\s+influence|fraud|misrepresentation)"
+        ]
+    }
+}
+
+# Sector-specific compliance
+_EMPLOYMENT_COMPLIANCE = {
+    "minimum_wage": {
+        "description": "Must comply with Minimum Wages Act",
+        "check": "salary_amount"
+    },
+    "working_hours": {
+        "description": "Maximum 48 hours/week as per Factories Act",
+        "patterns": [r"(\d+)\s*hours?\s*(?:per\s+)?(?:week|day)"]
+    },
+    "leave_policy": {
+        "description": "Must provide statutory leave entitlements",
+        "patterns": [
+            r"(?:annual|earned|casual|sick)\s+leave",
+            r"(\d+)\s*days?\s*(?:of\s+)?leave"
+        ]
+    },
+    "pf_esi": {
+        "description": "EPF/ESI deductions may be applicable",
+        "patterns": [
+            r"(?:provident\s+fund|pf|epf|esi)",
+            r"(?:employer\s+contribution|employee\s+contribution)"
+        ]
+    },
+    "gratuity": {
+        "description": "Gratuity applicable for 5+ years service",
+        "patterns": [r"gratuity"]
+    },
+    "notice_period": {
+        "description": "Notice requirements for termination",
+        "patterns": [r"notice\s+period\s+of\s+(\d+)\s*(?:days?|months?)"]
+    }
+}
+
+_LEASE_COMPLIANCE = {
+    "stamp_duty": {
+        "description": "Lease agreements require stamp duty payment",
+        "patterns": [r"stamp\s+duty", r"registration"]
+    },
+    "registration": {
+        "description": "Leases > 12 months must be registered",
+        "patterns": [r"register(?:ed|ation)", r"sub-?registrar"]
+    },
+    "rent_control": {
+        "description": "May be subject to state Rent Control Act",
+        "patterns": [r"rent\s+control\s+act", r"standard\s+rent"]
+    }
+}
+
+_GENERAL_COMPLIANCE = {
+    "stamp_paper": {
+        "description": "Contract may require execution on stamp paper",
+        "patterns": [r"stamp\s+paper", r"stamp\s+duty", r"e-?stamp"]
+    },
+    "witness": {
+        "description": "Witnesses may be required for validity",
+        "patterns": [r"witness(?:es)?", r"attestation", r"attest(?:ed)?"]
+    },
+    "jurisdiction": {
+        "description": "Exclusive jurisdiction clauses should be reasonable",
+        "patterns": [r"(?:exclusive\s+)?jurisdiction\s+(?:of\s+)?(?:courts?\s+(?:at|of|in))"]
+    },
+    "arbitration": {
+        "description": "Must comply with Arbitration & Conciliation Act",
+        "patterns": [r"arbitration", r"arbitration\s+and\s+conciliation\s+act"]
+    }
+}
+
+
+def _freeze(config):
+    """Return a read-only view of a check config: mappings become proxies, lists tuples"""
+    if isinstance(config, dict):
+        return MappingProxyType({key: _freeze(value) for key, value in config.items()})
+    if isinstance(config, list):
+        return tuple(_freeze(item) for item in config)
+    return config
+
+
+def _compile(source: str):
+    """Compile a lowercase pattern with the configured regex backend"""
+    if _RE is not re:
+        try:
+            return _RE.compile(source)
+        except re2.error:
+            # Fall back to the stdlib engine for syntax RE2 does not support
+            pass
+    return re.compile(source)
+
+
+def _fuse_alternatives(patterns: Tuple[str, ...]) -> Tuple[str, ...]:
+    """Fuse a check's alternative patterns into a single union regex"""
+    if len(patterns) < 2:
+        return patterns
+    return ("|".join(f"(?:{p})" for p in patterns),)
+
+
+def _to_columns(checks: Dict, compiled_by_source: Dict) -> _CheckColumns:
+    """Split a section's config into pattern-backed and manual-review columns"""
+    names, descriptions, patterns = [], [], []
+    manual_names, manual_descriptions = [], []
+    
+    for check_name, check_config in checks.items():
+        if "patterns" in check_config:
+            sources = _fuse_alternatives(check_config["patterns"])
+            names.append(check_name)
+            descriptions.append(check_config["description"])
+            patterns.append(tuple(
+                compiled_by_source.setdefault(source, _compile(source))
+                for source in sources
+            ))
+        else:
+            manual_names.append(check_name)
+            manual_descriptions.append(check_config["description"])
+    
+    return _CheckColumns(
+        tuple(checks), tuple(names), tuple(descriptions), tuple(patterns),
+        tuple(manual_names), tuple(manual_descriptions)
+    )
+
+
+# The configs are compiled below, so editing them later would have no
+# effect; freeze them to make that an error instead
+_BASIC_REQUIREMENTS = _freeze(_BASIC_REQUIREMENTS)
+_EMPLOYMENT_COMPLIANCE = _freeze(_EMPLOYMENT_COMPLIANCE)
+_LEASE_COMPLIANCE = _freeze(_LEASE_COMPLIANCE)
+_GENERAL_COMPLIANCE = _freeze(_GENERAL_COMPLIANCE)
+
+# Compile every check's patterns once per process so each call only runs the
+# matchers. Patterns must be lowercase: they are matched against lowercased
+# text. Patterns shared between checks map to the same compiled object, which
+# lets a single call scan each distinct pattern only once.
+_compiled_by_source: Dict = {}
+_BASIC_COLUMNS = _to_columns(_BASIC_REQUIREMENTS, _compiled_by_source)
+_EMPLOYMENT_COLUMNS = _to_columns(_EMPLOYMENT_COMPLIANCE, _compiled_by_source)
+_LEASE_COLUMNS = _to_columns(_LEASE_COMPLIANCE, _compiled_by_source)
+_GENERAL_COLUMNS = _to_columns(_GENERAL_COMPLIANCE, _compiled_by_source)
+del _compiled_by_source
 
 
 class ComplianceChecker:
     """Check contract compliance with Indian business law requirements"""
     
+    # Texts shorter than this (ignoring surrounding whitespace) are not scanned
+    MIN_TEXT_LEN = 200
+    
+    # Check configuration, shared by all instances and read-only
+    basic_requirements = _BASIC_REQUIREMENTS
+    employment_compliance = _EMPLOYMENT_COMPLIANCE
+    lease_compliance = _LEASE_COMPLIANCE
+    general_compliance = _GENERAL_COMPLIANCE
+    
     def __init__(self):
-        # Indian Contract Act 1872 requirements
-        self.basic_requirements = {
-            "parties": {
-                "description": "Contract must clearly identify all parties",
-                "patterns": [
-                    r"(?:between|party|parties)",
-                    r"(?:first\s+party|second\s+party)",
-                    r"(?:company|employer|employee|vendor|client)"
-                ]
-            },
-            "consideration": {
-                "description": "Contract must have lawful consideration",
-                "patterns": [
-                    r"(?:consideration|payment|compensation|fee|salary|price)",
-                    r"(?:Rs\.?|INR|₹)\s*[\d,]+"
-                ]
-            },
-            "lawful_object": {
-                "description": "Contract object must be lawful"
-            },
-            "free_consent": {
-                "description": "Contract requires free consent of parties",
-                "warning_patterns": [
-                    r"(?:coercion|undue\s+influence|fraud|misrepresentation)"
-                ]
-            }
-        }
-        
-        # Sector-specific compliance
-        self.employment_compliance = {
-            "minimum_wage": {
-                "description": "Must comply with Minimum Wages Act",
-                "check": "salary_amount"
-            },
-            "working_hours": {
-                "description": "Maximum 48 hours/week as per Factories Act",
-                "patterns": [r"(\d+)\s*hours?\s*(?:per\s+)?(?:week|day)"]
-            },
-            "leave_policy": {
-                "description": "Must provide statutory leave entitlements",
-                "patterns": [
-                    r"(?:annual|earned|casual|sick)\s+leave",
-                    r"(\d+)\s*days?\s*(?:of\s+)?leave"
-                ]
-            },
-            "pf_esi": {
-                "description": "EPF/ESI deductions may be applicable",
-                "patterns": [
-                    r"(?:provident\s+fund|PF|EPF|ESI)",
-                    r"(?:employer\s+contribution|employee\s+contribution)"
-                ]
-            },
-            "gratuity": {
-                "description": "Gratuity applicable for 5+ years service",
-                "patterns": [r"gratuity"]
-            },
-            "notice_period": {
-                "description": "Notice requirements for termination",
-                "patterns": [r"notice\s+period\s+of\s+(\d+)\s*(?:days?|months?)"]
-            }
-        }
-        
-        self.lease_compliance = {
-            "stamp_duty": {
-                "description": "Lease agreements require stamp duty payment",
-                "patterns": [r"stamp\s+duty", r"registration"]
-            },
-            "registration": {
-                "description": "Leases > 12 months must be registered",
-                "patterns": [r"register(?:ed|ation)", r"sub-?registrar"]
-            },
-            "rent_control": {
-                "description": "May be subject to state Rent Control Act",
-                "patterns": [r"rent\s+control\s+act", r"standard\s+rent"]
-            }
-        }
-        
-        self.general_compliance = {
-            "stamp_paper": {
-                "description": "Contract may require execution on stamp paper",
-                "patterns": [r"stamp\s+paper", r"stamp\s+duty", r"e-?stamp"]
-            },
-            "witness": {
-                "description": "Witnesses may be required for validity",
-                "patterns": [r"witness(?:es)?", r"attestation", r"attest(?:ed)?"]
-            },
-            "jurisdiction": {
-                "description": "Exclusive jurisdiction clauses should be reasonable",
-                "patterns": [r"(?:exclusive\s+)?jurisdiction\s+(?:of\s+)?(?:courts?\s+(?:at|of|in))"]
-            },
-            "arbitration": {
-                "description": "Must comply with Arbitration & Conciliation Act",
-                "patterns": [r"arbitration", r"Arbitration\s+and\s+Conciliation\s+Act"]
-            }
-        }
+        # Recent results keyed by (text digest, contract type), oldest first;
+        # the lock lets one checker be shared between sessions
+        self._cache: Dict[Tuple[bytes, str], bytes] = {}
+        self._cache_lock = threading.Lock()
     
-    def check_compliance(self, text: str, contract_type: str = "general") -> Dict:
+    def check_compliance(self, text: str, contract_type: str = "general",
+                         no_cache: bool = False) -> Dict:
         """
         Check contract for compliance issues
         
+        Results are cached per text and contract type; every call returns
+        its own copy, safe for the caller to modify.
+        
         Args:
             text: Contract text
             contract_type: Type of contract (employment, lease, vendor, etc.)
+            no_cache: Bypass the result cache for this call
             
         Returns:
             Dict with compliance findings
         """
-        text_lower = text.lower()
+        if len(text.strip()) < self.MIN_TEXT_LEN:
+            return {
+                "basic_requirements": {},
+                "general_compliance": {},
+                "issues": [],
+                "warnings": [],
+                "recommendations": [],
+                "compliance_score": 0.0,
+                "status": "insufficient_text"
+            }
+        
+        if no_cache:
+            return self._run_checks(text, contract_type)
+        
+        key = (hashlib.blake2b(text.encode(), digest_size=16).digest(), contract_type)
+        with self._cache_lock:
+            cached = self._cache.get(key)
+        if cached is not None:
+            return pickle.loads(cached)
+        
+        results = self._run_checks(text, contract_type)
+        
+        # The cache holds serialised bytes so a miss stays about as fast as an
+        # uncached check; hits rebuild an independent result from them
+        frozen = pickle.dumps(results, pickle.HIGHEST_PROTOCOL)
+        with self._cache_lock:
+            if len(self._cache) >= _CACHE_SIZE:
+                self._cache.pop(next(iter(self._cache)), None)
+            self._cache[key] = frozen
+        return results
+    
+    def clear_cache(self):
+        """Drop all cached check_compliance results"""
+        with self._cache_lock:
+            self._cache.clear()
+    
+    def _run_checks(self, text: str, contract_type: str) -> Dict:
+        """Run every applicable compliance check on the text"""
+        # Patterns are written in lowercase, so fold the text once instead of
+        # matching case-insensitively
+        text = text.lower()
+        
+        # Matches per compiled pattern, shared by all checks in this call
+        hits = {}
         
         results = {
             "basic_requirements": self._check_basic_requirements(text),
-            "general_compliance": self._check_general(text),
+            "general_compliance": self._check_general(text, hits),
             "issues": [],
             "warnings": [],
             "recommendations": []
@@ -129,9 +307,9 @@ class ComplianceChecker:
         
         # Add contract-type specific checks
         if contract_type == "employment_agreement":
-            results["employment_compliance"] = self._check_employment(text)
+            results["employment_compliance"] = self._check_employment(text, hits)
         elif contract_type == "lease_agreement":
-            results["lease_compliance"] = self._check_lease(text)
+            results["lease_compliance"] = self._check_lease(text, hits)
         
         # Compile issues and recommendations
         self._compile_findings(results)
@@ -143,151 +321,173 @@ class ComplianceChecker:
     
     def _check_basic_requirements(self, text: str) -> Dict:
         """Check basic contract requirements"""
-        findings = {}
+        columns = _BASIC_COLUMNS
+        findings = dict.fromkeys(columns.order)
         
-        for req_name, req_config in self.basic_requirements.items():
-            if "patterns" in req_config:
-                found = any(
-                    re.search(pattern, text, re.IGNORECASE)
-                    for pattern in req_config["patterns"]
-                )
-                findings[req_name] = {
-                    "description": req_config["description"],
-                    "found": found,
-                    "status": "[OK] Found" if found else "[!] Not clearly specified"
-                }
-            else:
-                findings[req_name] = {
-                    "description": req_config["description"],
-                    "status": "[!] Manual review required"
-                }
+        for req_name, description, patterns in zip(
+                columns.names, columns.descriptions, columns.patterns):
+            found = any(pattern.search(text) for pattern in patterns)
+            findings[req_name] = {
+                "description": description,
+                "found": found,
+                "status": "[OK] Found" if found else "[!] Not clearly specified"
+            }
         
+        # Requirements that need manual review do not count against the score
+        self._add_manual_checks(findings, columns, always_passes=True)
         return findings
     
-    def _check_employment(self, text: str) -> Dict:
+    def _check_employment(self, text: str, hits: Dict) -> Dict:
         """Check employment-specific compliance"""
-        findings = {}
+        columns = _EMPLOYMENT_COLUMNS
+        findings = dict.fromkeys(columns.order)
         
-        for check_name, check_config in self.employment_compliance.items():
-            if "patterns" in check_config:
-                matches = []
-                for pattern in check_config["patterns"]:
-                    found = re.findall(pattern, text, re.IGNORECASE)
-                    matches.extend(found)
-                
-                findings[check_name] = {
-                    "description": check_config["description"],
-                    "found": len(matches) > 0,
-                    "matches": matches[:5],  # Limit matches
-                    "status": "[OK] Addressed" if matches else "[!] Not specified"
-                }
-            else:
-                findings[check_name] = {
-                    "description": check_config["description"],
-                    "status": "[!] Manual review required"
-                }
+        for check_name, description, patterns in zip(
+                columns.names, columns.descriptions, columns.patterns):
+            matches = []
+            for pattern in patterns:
+                matches.extend(self._find_matches(pattern, text, hits))
+            
+            findings[check_name] = {
+                "description": description,
+                "found": len(matches) > 0,
+                "matches": matches[:MAX_MATCHES],
+                "status": "[OK] Addressed" if matches else "[!] Not specified"
+            }
         
+        self._add_manual_checks(findings, columns)
         return findings
     
-    def _check_lease(self, text: str) -> Dict:
+    def _check_lease(self, text: str, hits: Dict) -> Dict:
         """Check lease-specific compliance"""
-        findings = {}
+        columns = _LEASE_COLUMNS
+        findings = dict.fromkeys(columns.order)
         
-        for check_name, check_config in self.lease_compliance.items():
+        for check_name, description, patterns in zip(
+                columns.names, columns.descriptions, columns.patterns):
             matches = []
-            for pattern in check_config["patterns"]:
-                found = re.findall(pattern, text, re.IGNORECASE)
-                matches.extend(found)
+            for pattern in patterns:
+                matches.extend(self._find_matches(pattern, text, hits))
             
             findings[check_name] = {
-                "description": check_config["description"],
+                "description": description,
                 "found": len(matches) > 0,
                 "status": "[OK] Mentioned" if matches else "[!] Not addressed"
             }
         
+        self._add_manual_checks(findings, columns)
+        
         # Check if registration might be required (lease > 12 months)
-        duration_match = re.search(r'(\d+)\s*(?:months?|years?)', text, re.IGNORECASE)
-        if duration_match:
-            duration_text = duration_match.group(0).lower()
-            if "year" in duration_text or (duration_match.group(1).isdigit() and int(duration_match.group(1)) > 12 and "month" in duration_text):
-                findings["registration_required"] = {
-                    "description": "Lease exceeds 12 months - Registration mandatory under Registration Act",
-                    "status": "⚠ Registration required",
-                    "action": "Register with Sub-Registrar office"
-                }
+        duration_match = _DURATION_RE.search(text)
+        if duration_match and (duration_match.group(2) == "year" or int(duration_match.group(1)) > 12):
+            findings["registration_required"] = {
+                "description": "Lease exceeds 12 months - Registration mandatory under Registration Act",
+                "status": "⚠ Registration required",
+                "action": "Register with Sub-Registrar office"
+            }
         
         return findings
     
-    def _check_general(self, text: str) -> Dict:
+    def _check_general(self, text: str, hits: Dict) -> Dict:
         """Check general compliance requirements"""
-        findings = {}
+        columns = _GENERAL_COLUMNS
+        findings = dict.fromkeys(columns.order)
         
-        for check_name, check_config in self.general_compliance.items():
+        for check_name, description, patterns in zip(
+                columns.names, columns.descriptions, columns.patterns):
             matches = []
-            for pattern in check_config["patterns"]:
-                found = re.findall(pattern, text, re.IGNORECASE)
-                matches.extend(found)
+            for pattern in patterns:
+                matches.extend(self._find_matches(pattern, text, hits))
             
             findings[check_name] = {
-                "description": check_config["description"],
+                "description": description,
                 "found": len(matches) > 0,
                 "status": "[OK] Addressed" if matches else "[i] Not explicitly mentioned"
             }
         
+        self._add_manual_checks(findings, columns)
         return findings
     
+    @staticmethod
+    def _add_manual_checks(findings: Dict, columns: _CheckColumns,
+                           always_passes: bool = False) -> None:
+        """Fill in checks that have no patterns and need manual review"""
+        for check_name, description in zip(columns.manual_names, columns.manual_descriptions):
+            findings[check_name] = {
+                "description": description,
+                "status": "[!] Manual review required"
+            }
+            if always_passes:
+                findings[check_name]["always_passes"] = True
+    
+    @staticmethod
+    def _find_matches(pattern, text: str, hits: Dict) -> List[str]:
+        """
+        Return up to MAX_MATCHES whole matches of a pattern
+        
+        Scanning stops at the cap, and each pattern walks the text at most
+        once per call.
+        """
+        found = hits.get(pattern)
+        if found is None:
+            found = hits[pattern] = []
+            for match in pattern.finditer(text):
+                found.append(match.group(0))
+                if len(found) >= MAX_MATCHES:
+                    break
+        return found
+    
     def _compile_findings(self, results: Dict) -> None:
         """Compile issues and recommendations from all checks"""
+        issues = results["issues"]
+        warnings = results["warnings"]
+        recs = results["recommendations"]
+        basic = results.get("basic_requirements") or {}
+        emp = results.get("employment_compliance") or {}
+        lease = results.get("lease_compliance") or {}
+        gen = results.get("general_compliance") or {}
+        
         # Check basic requirements
-        for req_name, req_data in results.get("basic_requirements", {}).items():
+        for req_name, req_data in basic.items():
             if not req_data.get("found", True) and req_name != "lawful_object":
-                results["issues"].append(f"{req_data['description']} - not clearly specified")
+                issues.append(f"{req_data['description']} - not clearly specified")
         
         # Employment-specific issues
-        for check_name, check_data in results.get("employment_compliance", {}).items():
+        for check_data in emp.values():
             if not check_data.get("found", True):
-                results["warnings"].append(f"{check_data['description']} - should be addressed")
+                warnings.append(f"{check_data['description']} - should be addressed")
         
         # Lease-specific issues
-        for check_name, check_data in results.get("lease_compliance", {}).items():
+        for check_name, check_data in lease.items():
             if check_name == "registration_required":
-                results["issues"].append(check_data.get("action", ""))
+                issues.append(check_data.get("action", ""))
             elif not check_data.get("found", True):
-                results["warnings"].append(f"{check_data['description']}")
+                warnings.append(f"{check_data['description']}")
         
         # Add recommendations
-        if not results.get("general_compliance", {}).get("stamp_paper", {}).get("found"):
-            results["recommendations"].append(
+        gen_found = {k: gen.get(k, {}).get("found") for k in ("stamp_paper", "witness")}
+        if not gen_found["stamp_paper"]:
+            recs.append(
                 "Consider executing the contract on appropriate stamp paper as per applicable state laws"
             )
         
-        if not results.get("general_compliance", {}).get("witness", {}).get("found"):
-            results["recommendations"].append(
+        if not gen_found["witness"]:
+            recs.append(
                 "Consider having the contract attested by witnesses for stronger enforceability"
             )
     
     def _calculate_score(self, results: Dict) -> float:
         """Calculate overall compliance score"""
-        total_checks = 0
-        passed_checks = 0
-        
-        # Count basic requirements
-        for req_data in results.get("basic_requirements", {}).values():
-            total_checks += 1
-            if req_data.get("found", False) or "Manual" in req_data.get("status", ""):
-                passed_checks += 1
+        total = passed = 0
+        for check_data in chain(
+                (results.get("basic_requirements") or {}).values(),
+                (results.get("employment_compliance") or {}).values(),
+                (results.get("lease_compliance") or {}).values()):
+            total += 1
+            if check_data.get("found") or check_data.get("always_passes"):
+                passed += 1
         
-        # Count type-specific compliance
-        for compliance_type in ["employment_compliance", "lease_compliance"]:
-            for check_data in results.get(compliance_type, {}).values():
-                total_checks += 1
-                if check_data.get("found", False):
-                    passed_checks += 1
-        
-        if total_checks == 0:
-            return 100.0
-        
-        return round((passed_checks / total_checks) * 100, 1)
+        return 100.0 if total == 0 else round(passed / total * 100, 1)
     
     def get_compliance_summary(self, results: Dict) -> Dict:
         """Generate SME-friendly compliance summary"""
@@ -295,17 +495,10 @@ class ComplianceChecker:
         
         summary = {
             "score": score,
-            "status": "",
+            "status": next(msg for threshold, msg in _STATUS_LADDER if score >= threshold),
             "key_issues": results.get("issues", [])[:5],
             "warnings": results.get("warnings", [])[:5],
             "action_items": results.get("recommendations", [])[:5]
         }
         
-        if score >= 80:
-            summary["status"] = "[GOOD] Good Compliance - Contract addresses most legal requirements"
-        elif score >= 60:
-            summary["status"] = "[MODERATE] Moderate Compliance - Some requirements may need attention"
-        else:
-            summary["status"] = "[LOW] Low Compliance - Several legal requirements may not be addressed"
-        
         return summary
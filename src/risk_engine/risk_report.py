@@ -2,13 +2,63 @@
 Risk Report Generator
 Generates structured risk reports for contracts
 """
+import functools
+import time
+from itertools import count, islice
 from typing import Dict, List
 from datetime import datetime
 
+# Per-process sequence appended to report IDs so IDs stay unique within a second
+_id_counter = count()
+
+# Maximum entities of each kind carried into a report
+_MAX_ENTITIES = 50
+
+# Characters kept of finding descriptions, and of context and statement snippets
+_DESCRIPTION_MAX_CHARS = 100
+_SNIPPET_MAX_CHARS = 200
+
+# Plain-text report separators and banner
+_SEP60 = "=" * 60
+_SEP40 = "=" * 40
+_REPORT_HEADER = f"{_SEP60}\nCONTRACT RISK ANALYSIS REPORT\n{_SEP60}"
+
+# Recommended next steps by overall risk score band
+_NEXT_STEPS_HIGH = (
+    "1. Do NOT sign this contract without professional legal review",
+    "2. Identify the top 3 high-risk clauses for negotiation",
+    "3. Prepare counter-proposals for risky terms",
+    "4. Consider seeking alternative vendors/partners if negotiation fails",
+    "5. Document all negotiations and changes"
+)
+_NEXT_STEPS_MED = (
+    "1. Review all flagged clauses carefully",
+    "2. Create a list of terms you want to negotiate",
+    "3. Discuss concerns with the other party",
+    "4. Consider limited legal review for high-risk clauses",
+    "5. Ensure all agreed changes are documented in writing"
+)
+_NEXT_STEPS_LOW = (
+    "1. Perform a final read-through of the contract",
+    "2. Verify all details (names, dates, amounts) are correct",
+    "3. Ensure you have copies of all related documents",
+    "4. Sign and retain a copy for your records",
+    "5. Set reminders for key dates (renewals, reviews)"
+)
+
+
+@functools.lru_cache(maxsize=128)
+def _pretty(name: str) -> str:
+    """Turn a snake_case clause type into a display title"""
+    return name.replace("_", " ").title()
+
 
 class RiskReportGenerator:
     """Generate comprehensive risk reports"""
     
+    # Stateless generator: no per-instance __dict__ needed
+    __slots__ = ()
+    
     def __init__(self):
         pass
     
@@ -35,7 +85,7 @@ class RiskReportGenerator:
         """
         report = {
             "report_id": self._generate_report_id(),
-            "generated_at": datetime.now().isoformat(),
+            "generated_at": datetime.now().isoformat(timespec="seconds"),
             "contract_info": self._format_contract_info(contract_info),
             "executive_summary": self._generate_executive_summary(
                 risk_score, clause_detections, compliance
@@ -57,7 +107,7 @@ class RiskReportGenerator:
     
     def _generate_report_id(self) -> str:
         """Generate unique report ID"""
-        return f"CR-{datetime.now().strftime('%Y%m%d%H%M%S')}"
+        return f"CR-{time.strftime('%Y%m%d%H%M%S')}-{next(_id_counter):04x}"
     
     def _format_contract_info(self, info: Dict) -> Dict:
         """Format basic contract information"""
@@ -78,13 +128,14 @@ class RiskReportGenerator:
         compliance_score = compliance.get("compliance_score", 0)
         
         # Count high-risk items
-        high_risk_count = sum(
-            1 for detection in clause_detections.values()
-            if detection.get("found") and any(
-                f.get("risk_level") == "high" 
-                for f in detection.get("findings", [])
-            )
-        )
+        high_risk_count = 0
+        for detection in clause_detections.values():
+            if not detection.get("found"):
+                continue
+            for f in detection.get("findings", ()):
+                if f.get("risk_level") == "high":
+                    high_risk_count += 1
+                    break
         
         # Determine overall status
         if composite_score >= 7 or high_risk_count >= 3:
@@ -121,6 +172,7 @@ class RiskReportGenerator:
     
     def _format_risk_assessment(self, risk_score: Dict, clause_detections: Dict) -> Dict:
         """Format detailed risk assessment"""
+        g = dict.get
         return {
             "composite_score": risk_score.get("composite_score", 0),
             "risk_level": risk_score.get("risk_level", "unknown"),
@@ -129,9 +181,9 @@ class RiskReportGenerator:
             "sme_concerns": risk_score.get("sme_concerns", []),
             "detected_clauses": {
                 name: {
-                    "found": data.get("found", False),
-                    "count": data.get("count", 0),
-                    "recommendation": data.get("recommendation")
+                    "found": g(data, "found", False),
+                    "count": g(data, "count", 0),
+                    "recommendation": g(data, "recommendation")
                 }
                 for name, data in clause_detections.items()
             }
@@ -152,10 +204,10 @@ class RiskReportGenerator:
                     if finding.get("risk_level") == "high":
                         findings.append({
                             "priority": priority,
-                            "category": clause_type.replace("_", " ").title(),
+                            "category": _pretty(clause_type),
                             "severity": "HIGH",
-                            "description": finding.get("text", "")[:100],
-                            "context": finding.get("context", "")[:200],
+                            "description": (finding.get("text") or "")[:_DESCRIPTION_MAX_CHARS],
+                            "context": (finding.get("context") or "")[:_SNIPPET_MAX_CHARS],
                             "recommendation": detection.get("recommendation")
                         })
                         priority += 1
@@ -191,35 +243,36 @@ class RiskReportGenerator:
         return {
             "parties": [
                 {"name": p.get("name"), "type": p.get("type")}
-                for p in entities.get("parties", [])
+                for p in islice(entities.get("parties") or (), _MAX_ENTITIES)
             ],
             "dates": [
-                d.get("raw") for d in entities.get("dates", [])
+                d.get("raw") for d in islice(entities.get("dates") or (), _MAX_ENTITIES)
             ],
             "amounts": [
                 {"value": a.get("value"), "currency": a.get("currency")}
-                for a in entities.get("amounts", [])
+                for a in islice(entities.get("amounts") or (), _MAX_ENTITIES)
             ],
             "durations": [
-                d.get("raw") for d in entities.get("durations", [])
+                d.get("raw") for d in islice(entities.get("durations") or (), _MAX_ENTITIES)
             ],
             "jurisdictions": entities.get("jurisdictions", [])
         }
     
     def _format_obligations(self, obligations: Dict) -> Dict:
         """Format obligation analysis"""
+        summary = obligations.get("summary") or {}
         return {
-            "total_obligations": obligations.get("summary", {}).get("total_obligations", 0),
-            "total_rights": obligations.get("summary", {}).get("total_rights", 0),
-            "total_prohibitions": obligations.get("summary", {}).get("total_prohibitions", 0),
-            "strong_obligations": obligations.get("summary", {}).get("strong_obligations", 0),
+            "total_obligations": summary.get("total_obligations", 0),
+            "total_rights": summary.get("total_rights", 0),
+            "total_prohibitions": summary.get("total_prohibitions", 0),
+            "strong_obligations": summary.get("strong_obligations", 0),
             "key_obligations": [
-                o.get("text", "")[:200] 
-                for o in obligations.get("obligations", [])[:5]
+                (o.get("text") or "")[:_SNIPPET_MAX_CHARS]
+                for o in islice(obligations.get("obligations") or (), 5)
             ],
             "key_prohibitions": [
-                p.get("text", "")[:200]
-                for p in obligations.get("prohibitions", [])[:5]
+                (p.get("text") or "")[:_SNIPPET_MAX_CHARS]
+                for p in islice(obligations.get("prohibitions") or (), 5)
             ]
         }
     
@@ -234,7 +287,7 @@ class RiskReportGenerator:
         for clause_type, detection in clause_detections.items():
             if detection.get("found") and detection.get("recommendation"):
                 recommendations.append({
-                    "category": clause_type.replace("_", " ").title(),
+                    "category": _pretty(clause_type),
                     "action": detection["recommendation"],
                     "priority": "high" if detection.get("has_broad_indemnity") or 
                                detection.get("has_full_transfer") else "medium"
@@ -264,44 +317,23 @@ class RiskReportGenerator:
         score = risk_score.get("composite_score", 0)
         
         if score >= 7:
-            return [
-                "1. Do NOT sign this contract without professional legal review",
-                "2. Identify the top 3 high-risk clauses for negotiation",
-                "3. Prepare counter-proposals for risky terms",
-                "4. Consider seeking alternative vendors/partners if negotiation fails",
-                "5. Document all negotiations and changes"
-            ]
+            return list(_NEXT_STEPS_HIGH)
         elif score >= 5:
-            return [
-                "1. Review all flagged clauses carefully",
-                "2. Create a list of terms you want to negotiate",
-                "3. Discuss concerns with the other party",
-                "4. Consider limited legal review for high-risk clauses",
-                "5. Ensure all agreed changes are documented in writing"
-            ]
+            return list(_NEXT_STEPS_MED)
         else:
-            return [
-                "1. Perform a final read-through of the contract",
-                "2. Verify all details (names, dates, amounts) are correct",
-                "3. Ensure you have copies of all related documents",
-                "4. Sign and retain a copy for your records",
-                "5. Set reminders for key dates (renewals, reviews)"
-            ]
+            return list(_NEXT_STEPS_LOW)
     
     def to_plain_text(self, report: Dict) -> str:
         """Convert report to plain text format"""
-        lines = []
-        lines.append("=" * 60)
-        lines.append("CONTRACT RISK ANALYSIS REPORT")
-        lines.append("=" * 60)
-        lines.append(f"\nReport ID: {report['report_id']}")
-        lines.append(f"Generated: {report['generated_at']}")
+        lines = [
+            _REPORT_HEADER,
+            f"\nReport ID: {report['report_id']}",
+            f"Generated: {report['generated_at']}",
+        ]
         
         # Executive Summary
         summary = report.get("executive_summary", {})
-        lines.append(f"\n{'='*40}")
-        lines.append("EXECUTIVE SUMMARY")
-        lines.append(f"{'='*40}")
+        lines.append(f"\n{_SEP40}\nEXECUTIVE SUMMARY\n{_SEP40}")
         lines.append(f"Status: {summary.get('overall_status', 'Unknown')}")
         lines.append(f"Risk Score: {summary.get('risk_score', 0)}/10")
         lines.append(f"Compliance Score: {summary.get('compliance_score', 0)}%")
@@ -311,22 +343,19 @@ class RiskReportGenerator:
         # Key Findings
         findings = report.get("key_findings", [])
         if findings:
-            lines.append(f"\n{'='*40}")
-            lines.append("KEY FINDINGS")
-            lines.append(f"{'='*40}")
+            lines.append(f"\n{_SEP40}\nKEY FINDINGS\n{_SEP40}")
             for finding in findings:
-                lines.append(f"\n[{finding.get('severity')}] {finding.get('category')}")
-                lines.append(f"  {finding.get('description', '')}")
+                lines.append(
+                    f"\n[{finding.get('severity')}] {finding.get('category')}\n"
+                    f"  {finding.get('description', '')}"
+                )
                 if finding.get('recommendation'):
                     lines.append(f"  → {finding['recommendation']}")
         
         # Next Steps
         next_steps = report.get("next_steps", [])
         if next_steps:
-            lines.append(f"\n{'='*40}")
-            lines.append("RECOMMENDED NEXT STEPS")
-            lines.append(f"{'='*40}")
-            for step in next_steps:
-                lines.append(step)
+            lines.append(f"\n{_SEP40}\nRECOMMENDED NEXT STEPS\n{_SEP40}")
+            lines.extend(next_steps)
         
         return "\n".join(lines)
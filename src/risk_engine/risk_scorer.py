@@ -2,13 +2,70 @@
 Risk Scorer
 Calculates clause-level and contract-level risk scores
 """
-from typing import Dict, List, Tuple
+from bisect import bisect_left
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 import re
+import threading
+
+# Number of distinct clause texts whose scores are remembered
+_CLAUSE_CACHE_SIZE = 2048
+
+# Findings recorded per indicator phrase in a clause; further matches
+# still add to the score and the severity tallies but are not listed
+_MAX_FINDINGS_PER_PATTERN = 5
+
+# Severities, in the order of the per-clause severity tallies
+_SEVERITIES = ("critical", "high", "medium", "low")
+_SEVERITY_INDEX = {severity: i for i, severity in enumerate(_SEVERITIES)}
+
+# Risk levels and the inclusive score upper bound of each but the last
+_RISK_LEVELS = ("low", "medium", "high")
+_RISK_LEVEL_BOUNDS = (3, 6)
+
+# Whitespace runs, collapsed so fixed phrases can be found with plain substring search
+_WHITESPACE_RE = re.compile(r"\s+")
+
+# Regex metacharacters; a pattern without them (besides \s+) is a fixed phrase
+_REGEX_META_RE = re.compile(r"[\\.^$*+?{}\[\]|()]")
+
+
+def _new_running() -> Dict:
+    """Fresh contract-level aggregates for one scoring run"""
+    return {
+        "count": 0,
+        "score_sum": 0.0,
+        "score_max": 0.0,
+        "severity_counts": [0] * len(_SEVERITIES),
+        "critical_count": 0,
+        "high_risk_count": 0,
+        "total_findings": 0,
+        "sme_concerns": [],
+    }
 
 
 class RiskScorer:
     """Calculate risk scores for contract clauses and overall contract"""
     
+    # Contract-level recommendations by composite score band
+    RECOMMENDATION_HIGH = (
+        "[HIGH RISK] This contract contains significant risks. "
+        "We strongly recommend legal review before signing. "
+        "Consider negotiating terms or seeking alternatives."
+    )
+    RECOMMENDATION_MODERATE = (
+        "[MODERATE RISK] This contract has some concerning clauses. "
+        "Review highlighted sections carefully and consider negotiating "
+        "modifications to high-risk terms."
+    )
+    RECOMMENDATION_LOW_MODERATE = (
+        "[LOW-MODERATE RISK] Contract has some standard risk clauses. "
+        "Review the flagged items but overall risk is manageable."
+    )
+    RECOMMENDATION_LOW = (
+        "[LOW RISK] Contract appears to have balanced terms. "
+        "Standard review recommended but no major concerns identified."
+    )
+    
     def __init__(self):
         # Risk indicators with severity weights
         self.risk_indicators = {
@@ -84,43 +141,165 @@ class RiskScorer:
                 r"exit\s+(?:fee|cost|charges)",
             ]
         }
+        
+        # Fixed phrases (e.g. "good faith") are counted with substring search
+        # on whitespace-collapsed text; only real regexes go to the re engine.
+        # Each indicator keeps its own matcher: fused into one alternation,
+        # overlapping indicators (e.g. "perpetual and irrevocable and
+        # unconditional") would hide each other's matches.
+        self._indicators = []
+        regex_patterns = []
+        for severity, config in self.risk_indicators.items():
+            for pattern in config["patterns"]:
+                phrase = self._as_phrase(pattern)
+                if phrase is None:
+                    regex_patterns.append(pattern)
+                self._indicators.append(
+                    (phrase, re.compile(pattern), severity, config["weight"])
+                )
+        
+        # Existence-only prefilter over every regex indicator: most clauses
+        # match none, and one scan then replaces the per-pattern scans
+        self._any_indicator = re.compile("|".join(f"(?:{p})" for p in regex_patterns))
+        
+        # SME patterns are searched one at a time, so overlapping patterns are
+        # all found, but only for concern types whose union matches somewhere
+        self._sme_unions = {
+            concern_type: re.compile("|".join(f"(?:{p})" for p in patterns))
+            for concern_type, patterns in self.sme_concerns.items()
+        }
+        self._compiled_sme = [
+            (re.compile(pattern), concern_type, pattern)
+            for concern_type, patterns in self.sme_concerns.items()
+            for pattern in patterns
+        ]
+        
+        # Words every SME pattern of a concern type contains one of
+        self._sme_required_tokens = {
+            "cash_flow_risk": ("payment", "net"),
+            "resource_risk": ("dedicated", "minimum", "exclusive"),
+            "exit_risk": ("termination", "exit"),
+        }
+        
+        # Clause results keyed by lowercased clause text, oldest first; the
+        # lock lets Streamlit sessions share one scorer
+        self._clause_cache: Dict[str, Dict] = {}
+        self._cache_lock = threading.Lock()
+    
+    @staticmethod
+    def _as_phrase(pattern: str):
+        """Return the fixed phrase a pattern matches, or None if it needs regex"""
+        phrase = pattern.replace(r"\s+", " ")
+        return None if _REGEX_META_RE.search(phrase) else phrase
     
-    def score_clause(self, clause_text: str) -> Dict:
+    def score_clause(self, clause_text: str, findings_limit: Optional[int] = None) -> Dict:
         """
         Calculate risk score for a single clause
         
+        Boilerplate clauses often repeat verbatim, so results are cached by
+        clause text; every call gets its own copy of the result, including
+        the findings and SME concern lists.
+        
         Args:
             clause_text: Text of the clause
+            findings_limit: If set, stop matching risk indicators once the
+                score is capped at 10 and this many findings are collected;
+                findings are then truncated to the limit
             
         Returns:
             Dict with risk score and details
         """
+        return self._score_clause_tallied(clause_text, findings_limit)[0]
+    
+    def _score_clause_tallied(self, clause_text: str,
+                              findings_limit: Optional[int] = None) -> Tuple[Dict, Tuple[int, ...]]:
+        """Score a clause, also returning its findings' per-severity counts"""
         text_lower = clause_text.lower()
+        key = text_lower if findings_limit is None else (text_lower, findings_limit)
+        with self._cache_lock:
+            cached = self._clause_cache.get(key)
+        if cached is None:
+            cached = self._score_clause_impl(text_lower, findings_limit)
+            with self._cache_lock:
+                if len(self._clause_cache) >= _CLAUSE_CACHE_SIZE:
+                    self._clause_cache.pop(next(iter(self._clause_cache)), None)
+                self._clause_cache[key] = cached
+        result, tally = cached
+        # The cached result is shared by every caller of a shared scorer, so
+        # nothing mutable in it is handed out
+        return {
+            **result,
+            "findings": [dict(finding) for finding in result["findings"]],
+            "sme_concerns": [dict(concern) for concern in result["sme_concerns"]],
+        }, tally
+    
+    def clear_cache(self):
+        """Drop all cached clause scores"""
+        with self._cache_lock:
+            self._clause_cache.clear()
+    
+    def _score_clause_impl(self, text_lower: str,
+                           findings_limit: Optional[int] = None) -> Tuple[Dict, Tuple[int, ...]]:
+        """Score an already lowercased clause, tallying findings by severity"""
         findings = []
+        # Severity counts of every match, including those beyond the findings
+        # cap, so contract totals stay exact without walking finding dicts
+        tally = [0] * len(_SEVERITIES)
         total_weight = 0.0
+        # With a findings limit, indicator matching stops once the score is
+        # capped and enough findings are in hand: more matches change nothing
+        limit = findings_limit if findings_limit is not None else float("inf")
         
-        # Check all risk indicators
-        for severity, config in self.risk_indicators.items():
-            for pattern in config["patterns"]:
-                matches = re.findall(pattern, text_lower, re.IGNORECASE)
-                for match in matches:
-                    findings.append({
-                        "pattern": match if isinstance(match, str) else pattern,
-                        "severity": severity,
-                        "weight": config["weight"]
-                    })
-                    total_weight += config["weight"]
+        text_collapsed = _WHITESPACE_RE.sub(" ", text_lower)
+        has_regex_match = self._any_indicator.search(text_lower) is not None
+        
+        # Check all risk indicators, in configuration order
+        for phrase, matcher, severity, weight in self._indicators:
+            if phrase is not None:
+                count = text_collapsed.count(phrase)
+                if count and text_lower.count(phrase) != count:
+                    # Some occurrence has other whitespace; record it as written
+                    matched = [m.group() for m in matcher.finditer(text_lower)]
+                else:
+                    matched = [phrase] * count
+                del matched[_MAX_FINDINGS_PER_PATTERN:]
+            elif has_regex_match:
+                matched = [m.group() for m in matcher.finditer(text_lower)]
+                count = len(matched)
+                del matched[_MAX_FINDINGS_PER_PATTERN:]
+            else:
+                continue
+            if not count:
+                continue
+            findings.extend(
+                {"pattern": text, "severity": severity, "weight": weight}
+                for text in matched
+            )
+            tally[_SEVERITY_INDEX[severity]] += count
+            total_weight += weight * count
+            if total_weight >= 10.0 and len(findings) >= limit:
+                break
+        
+        if findings_limit is not None:
+            del findings[findings_limit:]
         
-        # Check SME-specific concerns
+        # Check SME-specific concerns (each pattern counts once); a concern
+        # type's patterns only run if the clause contains a word they need
+        # and the type's combined pattern matches
         sme_findings = []
-        for concern_type, patterns in self.sme_concerns.items():
-            for pattern in patterns:
-                if re.search(pattern, text_lower, re.IGNORECASE):
-                    sme_findings.append({
-                        "type": concern_type,
-                        "pattern": pattern
-                    })
-                    total_weight += 1.5  # SME concerns have higher impact
+        required = self._sme_required_tokens
+        present = {
+            concern_type for concern_type, tokens in required.items()
+            if any(token in text_lower for token in tokens)
+            and self._sme_unions[concern_type].search(text_lower)
+        }
+        for pat, concern_type, pattern in self._compiled_sme:
+            if concern_type in present and pat.search(text_lower):
+                sme_findings.append({
+                    "type": concern_type,
+                    "pattern": pattern
+                })
+                total_weight += 1.5  # SME concerns have higher impact
         
         # Calculate normalized score (0-10)
         raw_score = min(10.0, total_weight)
@@ -131,7 +310,7 @@ class RiskScorer:
             "findings": findings,
             "sme_concerns": sme_findings,
             "requires_attention": raw_score >= 5.0
-        }
+        }, tuple(tally)
     
     def score_contract(self, clauses: List[Dict]) -> Dict:
         """
@@ -143,84 +322,116 @@ class RiskScorer:
         Returns:
             Dict with contract-level risk assessment
         """
-        clause_scores = []
-        all_findings = []
-        all_sme_concerns = []
-        critical_clauses = []
-        high_risk_clauses = []
+        # Aggregates stay local so a shared scorer can score concurrently
+        running = _new_running()
+        return self._finalize(running, list(self._iter_scored(clauses, running)))
+    
+    def iter_score_contract(self, clauses: Iterable[Dict]) -> "ScoringRun":
+        """
+        Score clauses one at a time, keeping contract-level aggregates
         
-        for clause in clauses:
-            text = clause.get("text", "")
-            clause_result = self.score_clause(text)
+        Iterating the returned run yields each clause's score entry as soon
+        as it is computed, so long contracts can be rendered or written out
+        without holding every result. Pass the exhausted run to ``finalize``.
+        Each run keeps its own aggregates, so a shared scorer can stream
+        several contracts at once.
+        
+        Args:
+            clauses: Iterable of clause dictionaries with text
+            
+        Returns:
+            ScoringRun yielding dicts with the clause number, heading, score,
+            level and findings
+        """
+        running = _new_running()
+        return ScoringRun(self._iter_scored(clauses, running), running)
+    
+    def _iter_scored(self, clauses: Iterable[Dict], running: Dict) -> Iterator[Dict]:
+        """Yield clause score entries, adding each into ``running``"""
+        severity_counts = running["severity_counts"]
+        
+        for clause, (clause_result, tally) in self._iter_clause_results(clauses):
+            score = clause_result["score"]
+            findings = clause_result["findings"]
+            
+            running["count"] += 1
+            running["score_sum"] += score
+            if score > running["score_max"]:
+                running["score_max"] = score
+            running["total_findings"] += sum(tally)
+            for i, n in enumerate(tally):
+                severity_counts[i] += n
+            running["sme_concerns"].extend(clause_result["sme_concerns"])
             
-            clause_scores.append({
+            if score >= 7:
+                running["critical_count"] += 1
+            elif score >= 5:
+                running["high_risk_count"] += 1
+            
+            yield {
                 "clause_number": clause.get("clause_number", ""),
                 "heading": clause.get("heading", ""),
-                "score": clause_result["score"],
+                "score": score,
                 "risk_level": clause_result["risk_level"],
-                "findings": clause_result["findings"]
-            })
-            
-            all_findings.extend(clause_result["findings"])
-            all_sme_concerns.extend(clause_result["sme_concerns"])
-            
-            if clause_result["score"] >= 7:
-                critical_clauses.append(clause)
-            elif clause_result["score"] >= 5:
-                high_risk_clauses.append(clause)
+                "findings": findings
+            }
+    
+    def finalize(self, run: "ScoringRun", clause_scores: Optional[List[Dict]] = None) -> Dict:
+        """
+        Build the contract-level assessment from an ``iter_score_contract`` run
         
+        Args:
+            run: The run returned by ``iter_score_contract``, fully iterated
+            clause_scores: Clause entries to include in the result, if kept
+            
+        Returns:
+            Dict with contract-level risk assessment
+        """
+        return self._finalize(run.running, clause_scores)
+    
+    def _finalize(self, running: Dict, clause_scores: Optional[List[Dict]] = None) -> Dict:
+        """Build the contract-level assessment from a set of aggregates"""
         # Calculate composite score
-        if clause_scores:
-            avg_score = sum(c["score"] for c in clause_scores) / len(clause_scores)
-            max_score = max(c["score"] for c in clause_scores)
+        if running["count"]:
+            avg_score = running["score_sum"] / running["count"]
             # Weighted: 40% average, 60% max (worst clause matters more)
-            composite_score = (avg_score * 0.4) + (max_score * 0.6)
+            composite_score = (avg_score * 0.4) + (running["score_max"] * 0.6)
         else:
             composite_score = 0.0
         
-        # Severity distribution
-        severity_counts = {"critical": 0, "high": 0, "medium": 0, "low": 0}
-        for finding in all_findings:
-            severity = finding.get("severity", "low")
-            severity_counts[severity] = severity_counts.get(severity, 0) + 1
-        
+        severity_counts = dict(zip(_SEVERITIES, running["severity_counts"]))
         return {
             "composite_score": round(composite_score, 1),
             "risk_level": self._get_risk_level(composite_score),
-            "clause_scores": clause_scores,
+            "clause_scores": clause_scores if clause_scores is not None else [],
             "severity_distribution": severity_counts,
-            "critical_clauses_count": len(critical_clauses),
-            "high_risk_clauses_count": len(high_risk_clauses),
-            "sme_concerns": all_sme_concerns,
-            "total_findings": len(all_findings),
+            "critical_clauses_count": running["critical_count"],
+            "high_risk_clauses_count": running["high_risk_count"],
+            "sme_concerns": running["sme_concerns"],
+            "total_findings": running["total_findings"],
             "recommendation": self._get_recommendation(composite_score, severity_counts)
         }
     
+    def _iter_clause_results(self, clauses: Iterable[Dict]) -> Iterator[Tuple[Dict, Tuple]]:
+        """Pair each clause with its score and tally, scoring lazily"""
+        for clause in clauses:
+            yield clause, self._score_clause_tallied(clause.get("text", ""))
+    
     def _get_risk_level(self, score: float) -> str:
         """Convert numeric score to risk level"""
-        if score <= 3:
-            return "low"
-        elif score <= 6:
-            return "medium"
-        else:
-            return "high"
+        # Upper bounds are inclusive: <= 3 is low, <= 6 is medium
+        return _RISK_LEVELS[bisect_left(_RISK_LEVEL_BOUNDS, score)]
     
     def _get_recommendation(self, score: float, severity_counts: Dict) -> str:
         """Generate recommendation based on score and findings"""
         if score >= 7:
-            return ("[HIGH RISK] This contract contains significant risks. "
-                   "We strongly recommend legal review before signing. "
-                   "Consider negotiating terms or seeking alternatives.")
+            return self.RECOMMENDATION_HIGH
         elif score >= 5:
-            return ("[MODERATE RISK] This contract has some concerning clauses. "
-                   "Review highlighted sections carefully and consider negotiating "
-                   "modifications to high-risk terms.")
+            return self.RECOMMENDATION_MODERATE
         elif score >= 3:
-            return ("[LOW-MODERATE RISK] Contract has some standard risk clauses. "
-                   "Review the flagged items but overall risk is manageable.")
+            return self.RECOMMENDATION_LOW_MODERATE
         else:
-            return ("[LOW RISK] Contract appears to have balanced terms. "
-                   "Standard review recommended but no major concerns identified.")
+            return self.RECOMMENDATION_LOW
     
     def get_risk_summary_for_sme(self, contract_score: Dict) -> Dict:
         """Generate SME-friendly risk summary"""
@@ -279,3 +490,30 @@ class RiskScorer:
             )
         
         return summary
+
+
+class ScoringRun:
+    """One streaming scoring pass: iterate it for clause entries, then finalize"""
+    
+    def __init__(self, entries: Iterator[Dict], running: Dict):
+        self._entries = entries
+        # Contract-level aggregates, updated as entries are yielded
+        self.running = running
+    
+    def __iter__(self) -> Iterator[Dict]:
+        return self._entries
+
+
+# Scorer shared by callers that do not need their own instance
+_default_scorer = None
+_default_scorer_lock = threading.Lock()
+
+
+def get_default_scorer() -> RiskScorer:
+    """Return the shared RiskScorer, building it on first use"""
+    global _default_scorer
+    if _default_scorer is None:
+        with _default_scorer_lock:
+            if _default_scorer is None:
+                _default_scorer = RiskScorer()
+    return _default_scorer
@@ -4,22 +4,28 @@ Reusable UI Components for Streamlit
 import streamlit as st
 from typing import Dict, List
 
+# Risk level colours for the score card
+_RISK_COLORS = {
+    "low": "#4CAF50",      # Green
+    "medium": "#FF9800",   # Orange
+    "high": "#F44336"      # Red
+}
 
-class UIComponents:
-    """Reusable UI components for the contract analyzer"""
-    
-    @staticmethod
-    def render_risk_score_card(score: float, level: str):
-        """Render a risk score card with visual indicator"""
-        colors = {
-            "low": "#4CAF50",      # Green
-            "medium": "#FF9800",   # Orange
-            "high": "#F44336"      # Red
-        }
-        
-        color = colors.get(level, "#9E9E9E")
-        
-        st.markdown(f"""
+# Severity icons and backgrounds for finding cards
+_FINDING_ICONS = {
+    "high": "🔴",
+    "medium": "🟡",
+    "low": "🟢"
+}
+_FINDING_COLORS = {
+    "high": "#FFEBEE",
+    "medium": "#FFF8E1",
+    "low": "#E8F5E9"
+}
+
+# HTML templates, built once at import; only the dynamic values are
+# substituted on each Streamlit rerun
+_RISK_CARD_TMPL = """
         <div style="
             background: linear-gradient(135deg, {color}22 0%, {color}11 100%);
             border-left: 4px solid {color};
@@ -31,7 +37,45 @@ class UIComponents:
             <div style="font-size: 42px; font-weight: bold; color: {color};">{score}/10</div>
             <div style="font-size: 16px; color: {color}; text-transform: uppercase;">{level} RISK</div>
         </div>
-        """, unsafe_allow_html=True)
+        """
+
+_FINDING_CARD_TMPL = """
+        <div style="
+            background-color: {bg_color};
+            border-radius: 8px;
+            padding: 15px;
+            margin: 10px 0;
+        ">
+            <div style="font-weight: bold; margin-bottom: 8px;">
+                {icon} {category}
+            </div>
+            <div style="color: #333; margin-bottom: 8px;">
+                {description}
+            </div>
+            <div style="font-size: 12px; color: #666; font-style: italic;">
+                💡 {recommendation}
+            </div>
+        </div>
+        """
+
+_TAG_TMPL = '<span style="background-color: {bg}; padding: 4px 8px; border-radius: 4px; margin: 2px;">{text}</span>'
+_PARTY_TAG_TMPL = _TAG_TMPL.replace("{bg}", "#E3F2FD")
+_AMOUNT_TAG_TMPL = _TAG_TMPL.replace("{bg}", "#E8F5E9")
+_DATE_TAG_TMPL = _TAG_TMPL.replace("{bg}", "#FFF3E0")
+
+
+class UIComponents:
+    """Reusable UI components for the contract analyzer"""
+    
+    @staticmethod
+    def render_risk_score_card(score: float, level: str):
+        """Render a risk score card with visual indicator"""
+        color = _RISK_COLORS.get(level, "#9E9E9E")
+        
+        st.markdown(
+            _RISK_CARD_TMPL.format(color=color, score=score, level=level),
+            unsafe_allow_html=True
+        )
     
     @staticmethod
     def render_metric_cards(metrics: List[Dict]):
@@ -50,39 +94,18 @@ class UIComponents:
     @staticmethod
     def render_finding_card(finding: Dict, severity: str = "medium"):
         """Render a finding/issue card"""
-        icons = {
-            "high": "🔴",
-            "medium": "🟡",
-            "low": "🟢"
-        }
-        
-        colors = {
-            "high": "#FFEBEE",
-            "medium": "#FFF8E1",
-            "low": "#E8F5E9"
-        }
-        
-        icon = icons.get(severity.lower(), "⚪")
-        bg_color = colors.get(severity.lower(), "#F5F5F5")
+        severity = severity.lower()
         
-        st.markdown(f"""
-        <div style="
-            background-color: {bg_color};
-            border-radius: 8px;
-            padding: 15px;
-            margin: 10px 0;
-        ">
-            <div style="font-weight: bold; margin-bottom: 8px;">
-                {icon} {finding.get('category', 'Finding')}
-            </div>
-            <div style="color: #333; margin-bottom: 8px;">
-                {finding.get('description', '')}
-            </div>
-            <div style="font-size: 12px; color: #666; font-style: italic;">
-                💡 {finding.get('recommendation', '')}
-            </div>
-        </div>
-        """, unsafe_allow_html=True)
+        st.markdown(
+            _FINDING_CARD_TMPL.format(
+                bg_color=_FINDING_COLORS.get(severity, "#F5F5F5"),
+                icon=_FINDING_ICONS.get(severity, "⚪"),
+                category=finding.get('category', 'Finding'),
+                description=finding.get('description', ''),
+                recommendation=finding.get('recommendation', '')
+            ),
+            unsafe_allow_html=True
+        )
     
     @staticmethod
     def render_clause_card(clause: Dict, expanded: bool = False):
@@ -119,37 +142,36 @@ class UIComponents:
     @staticmethod
     def render_entity_tags(entities: Dict):
         """Render extracted entities as tags"""
-        st.markdown("### 📋 Extracted Information")
+        # Collect every heading and tag row, then send them in one markdown
+        # call; blank lines keep each part a separate paragraph
+        parts = ["### 📋 Extracted Information"]
         
         # Parties
         parties = entities.get("parties", [])
         if parties:
-            st.markdown("**Parties:**")
-            party_html = " ".join([
-                f'<span style="background-color: #E3F2FD; padding: 4px 8px; border-radius: 4px; margin: 2px;">{p.get("name", "")}</span>'
-                for p in parties
-            ])
-            st.markdown(party_html, unsafe_allow_html=True)
+            parts.append("**Parties:**")
+            parts.append(" ".join(
+                _PARTY_TAG_TMPL.format(text=p.get("name", "")) for p in parties
+            ))
         
         # Amounts
         amounts = entities.get("amounts", [])
         if amounts:
-            st.markdown("**Financial Terms:**")
-            amount_html = " ".join([
-                f'<span style="background-color: #E8F5E9; padding: 4px 8px; border-radius: 4px; margin: 2px;">{a.get("currency", "")} {a.get("value", "")}</span>'
+            parts.append("**Financial Terms:**")
+            parts.append(" ".join(
+                _AMOUNT_TAG_TMPL.format(text=f'{a.get("currency", "")} {a.get("value", "")}')
                 for a in amounts
-            ])
-            st.markdown(amount_html, unsafe_allow_html=True)
+            ))
         
         # Dates
         dates = entities.get("dates", [])
         if dates:
-            st.markdown("**Key Dates:**")
-            date_html = " ".join([
-                f'<span style="background-color: #FFF3E0; padding: 4px 8px; border-radius: 4px; margin: 2px;">{d.get("raw", "")}</span>'
-                for d in dates[:5]
-            ])
-            st.markdown(date_html, unsafe_allow_html=True)
+            parts.append("**Key Dates:**")
+            parts.append(" ".join(
+                _DATE_TAG_TMPL.format(text=d.get("raw", "")) for d in dates[:5]
+            ))
+        
+        st.markdown("\n\n".join(parts), unsafe_allow_html=True)
     
     @staticmethod
     def render_progress_indicator(current: int, total: int, label: str = "Processing"):
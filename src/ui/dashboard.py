@@ -3,7 +3,17 @@ Dashboard Layout
 Main dashboard for contract analysis results
 """
 import streamlit as st
-from typing import Dict
+from typing import Dict, List
+
+# Clause filter labels and the risk level each selects (None selects all)
+_FILTER_LEVELS = {
+    "All": None,
+    "High Risk Only": "high",
+    "Medium Risk Only": "medium",
+    "Low Risk Only": "low"
+}
+
+_LEVEL_ICONS = {"high": "🔴", "medium": "🟡", "low": "🟢"}
 
 
 class Dashboard:
@@ -130,22 +140,18 @@ class Dashboard:
         # Filter options
         filter_option = st.selectbox(
             "Filter clauses by risk level:",
-            ["All", "High Risk Only", "Medium Risk Only", "Low Risk Only"]
+            list(_FILTER_LEVELS)
         )
         
-        for clause in clauses:
-            risk_level = clause.get("risk_level", "low")
-            
-            # Apply filter
-            if filter_option == "High Risk Only" and risk_level != "high":
-                continue
-            elif filter_option == "Medium Risk Only" and risk_level != "medium":
-                continue
-            elif filter_option == "Low Risk Only" and risk_level != "low":
-                continue
-            
-            icons = {"high": "🔴", "medium": "🟡", "low": "🟢"}
-            icon = icons.get(risk_level, "⚪")
+        # The level index is built once per analysis, not on every rerun
+        clause_index = st.session_state.get("clause_index")
+        if clause_index is None:
+            clause_index = Dashboard.index_clauses_by_level(clauses)
+        level = _FILTER_LEVELS[filter_option]
+        selected = clauses if level is None else clause_index.get(level, [])
+        
+        for clause in selected:
+            icon = _LEVEL_ICONS.get(clause.get("risk_level", "low"), "⚪")
             
             with st.expander(f"{icon} Clause {clause.get('clause_number', '')} - Score: {clause.get('score', 0)}/10"):
                 st.markdown(f"**Type:** {clause.get('clause_type', 'general').replace('_', ' ').title()}")
@@ -156,6 +162,14 @@ class Dashboard:
                     st.markdown("**Explanation:**")
                     st.info(clause["explanation"])
     
+    @staticmethod
+    def index_clauses_by_level(clauses: List[Dict]) -> Dict[str, List[Dict]]:
+        """Group clauses by risk level, keeping document order"""
+        index = {"high": [], "medium": [], "low": []}
+        for clause in clauses:
+            index.setdefault(clause.get("risk_level", "low"), []).append(clause)
+        return index
+    
     @staticmethod
     def _render_compliance(results: Dict):
         """Render compliance check results"""
@@ -5,54 +5,82 @@ Generates PDF reports for export
 from fpdf import FPDF
 from typing import Dict
 from datetime import datetime
+import functools
 import io
 import re
 
+# Common emojis and their text equivalents
+_EMOJI_REPLACEMENTS = {
+    "✅": "[OK]",
+    "❌": "[X]",
+    "⚠️": "[!]",
+    "🔴": "[HIGH]",
+    "🟡": "[MEDIUM]",
+    "🟢": "[LOW]",
+    "⚡": "[!]",
+    "📋": "",
+    "📊": "",
+    "📑": "",
+    "💡": "",
+    "💰": "",
+    "📅": "",
+    "⏱️": "",
+    "⚖️": "",
+    "🔍": "",
+    "📝": "",
+    "👥": "",
+    "🤖": "",
+    "📄": "",
+    "🏷️": "",
+    "✓": "[OK]",
+}
+
+# All emojis in one alternation, longest first so multi-codepoint
+# sequences win over their prefixes
+_EMOJI_RE = re.compile("|".join(
+    re.escape(emoji) for emoji in sorted(_EMOJI_REPLACEMENTS, key=len, reverse=True)
+))
+
+
+def _replace_emoji(match: re.Match) -> str:
+    """Text equivalent for a matched emoji"""
+    return _EMOJI_REPLACEMENTS[match.group()]
+
+
+@functools.lru_cache(maxsize=2048)
+def _sanitize_non_ascii(text: str) -> str:
+    """ASCII-only version of text; headings and categories repeat across reports"""
+    # Replace common emojis with text equivalents in a single pass
+    text = _EMOJI_RE.sub(_replace_emoji, text)
+    
+    # Remove any remaining non-ASCII characters that might cause issues
+    return text.encode('ascii', 'ignore').decode('ascii')
+
 
 class PDFReportGenerator:
     """Generate PDF reports from analysis results"""
     
+    # Cover page risk colours by overall status
+    COLOR_MAP = {
+        "HIGH_RISK": (244, 67, 54),
+        "MODERATE_RISK": (255, 152, 0),
+        "LOW_RISK": (76, 175, 80)
+    }
+    
     def __init__(self):
         self.pdf = None
+        self._generated_at = None
+        self._sanitized = None
     
     def _sanitize_text(self, text: str) -> str:
         """Remove Unicode characters not supported by Helvetica font"""
         if not text:
             return ""
         
-        # Replace common emojis with text equivalents
-        replacements = {
-            "✅": "[OK]",
-            "❌": "[X]",
-            "⚠️": "[!]",
-            "🔴": "[HIGH]",
-            "🟡": "[MEDIUM]",
-            "🟢": "[LOW]",
-            "⚡": "[!]",
-            "📋": "",
-            "📊": "",
-            "📑": "",
-            "💡": "",
-            "💰": "",
-            "📅": "",
-            "⏱️": "",
-            "⚖️": "",
-            "🔍": "",
-            "📝": "",
-            "👥": "",
-            "🤖": "",
-            "📄": "",
-            "🏷️": "",
-            "✓": "[OK]",
-        }
-        
-        for emoji, replacement in replacements.items():
-            text = text.replace(emoji, replacement)
-        
-        # Remove any remaining non-ASCII characters that might cause issues
-        text = text.encode('ascii', 'ignore').decode('ascii')
+        if text.isascii():
+            return text
         
-        return text
+        return _sanitize_non_ascii(text)
     
     def generate(self, analysis_results: Dict, file_name: str = "contract_analysis") -> bytes:
         """
@@ -68,9 +96,16 @@ class PDFReportGenerator:
         self.pdf = FPDF()
         self.pdf.set_auto_page_break(auto=True, margin=15)
         
+        # One timestamp for every page of this report
+        self._generated_at = datetime.now()
+        generated = self._generated_at.strftime('%Y-%m-%d %H:%M')
+        
         try:
+            # Scrub every free-text field once, before any page is laid out
+            self._sanitized = self._presanitize(analysis_results)
+            
             # Add pages
-            self._add_cover_page(analysis_results, file_name)
+            self._add_cover_page(analysis_results, file_name, generated)
             self._add_executive_summary(analysis_results)
             self._add_risk_analysis(analysis_results)
             self._add_key_findings(analysis_results)
@@ -85,7 +120,7 @@ class PDFReportGenerator:
             self.pdf.set_font("Helvetica", "", 12)
             self.pdf.cell(0, 20, "", ln=True)
             self.pdf.cell(0, 10, f"Document: {self._sanitize_text(file_name)}", ln=True)
-            self.pdf.cell(0, 10, f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M')}", ln=True)
+            self.pdf.cell(0, 10, f"Generated: {generated}", ln=True)
             self.pdf.cell(0, 20, "", ln=True)
             self.pdf.cell(0, 10, "Note: Full report generation encountered an issue.", ln=True)
             self.pdf.cell(0, 10, "Please view the analysis in the web interface.", ln=True)
@@ -93,7 +128,28 @@ class PDFReportGenerator:
         # Return as bytes
         return bytes(self.pdf.output())
     
-    def _add_cover_page(self, results: Dict, file_name: str):
+    def _presanitize(self, results: Dict) -> Dict:
+        """Sanitized copies of the report's free-text fields, as the sections use them"""
+        report = results.get("report", {})
+        summary = report.get("executive_summary", {})
+        return {
+            "one_liner": self._sanitize_text(summary.get("one_liner", "")),
+            "findings": [
+                (
+                    finding.get("severity", "MEDIUM"),
+                    self._sanitize_text(finding.get("category", "General")),
+                    self._sanitize_text(finding.get("description", "")[:200])
+                )
+                for finding in report.get("key_findings", [])[:10]
+            ],
+            "actions": [
+                self._sanitize_text(rec.get("action", "")[:150])
+                for rec in report.get("recommendations", [])[:8]
+            ],
+            "next_steps": [self._sanitize_text(step) for step in report.get("next_steps", [])],
+        }
+    
+    def _add_cover_page(self, results: Dict, file_name: str, generated: str):
         """Add cover page"""
         self.pdf.add_page()
         
@@ -107,7 +163,7 @@ class PDFReportGenerator:
         self.pdf.cell(0, 10, f"Document: {file_name}", ln=True, align="C")
         
         # Date
-        self.pdf.cell(0, 10, f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M')}", ln=True, align="C")
+        self.pdf.cell(0, 10, f"Generated: {generated}", ln=True, align="C")
         
         # Risk indicator
         report = results.get("report", {})
@@ -118,12 +174,7 @@ class PDFReportGenerator:
         self.pdf.cell(0, 30, "", ln=True)  # Spacing
         self.pdf.set_font("Helvetica", "B", 18)
         
-        color_map = {
-            "HIGH_RISK": (244, 67, 54),
-            "MODERATE_RISK": (255, 152, 0),
-            "LOW_RISK": (76, 175, 80)
-        }
-        color = color_map.get(risk_level, (158, 158, 158))
+        color = self.COLOR_MAP.get(risk_level, (158, 158, 158))
         self.pdf.set_text_color(*color)
         self.pdf.cell(0, 15, f"Risk Score: {risk_score}/10 ({risk_level.replace('_', ' ')})", ln=True, align="C")
         self.pdf.set_text_color(0, 0, 0)
@@ -142,9 +193,8 @@ class PDFReportGenerator:
         self.pdf.set_font("Helvetica", "", 11)
         
         # One-liner
-        one_liner = summary.get("one_liner", "")
-        if one_liner:
-            self.pdf.multi_cell(0, 7, self._sanitize_text(one_liner))
+        if summary.get("one_liner", ""):
+            self.pdf.multi_cell(0, 7, self._sanitized["one_liner"])
             self.pdf.ln(5)
         
         # Key metrics
@@ -193,16 +243,9 @@ class PDFReportGenerator:
         self.pdf.cell(0, 10, "KEY FINDINGS", ln=True)
         self.pdf.ln(5)
         
-        report = results.get("report", {})
-        findings = report.get("key_findings", [])
-        
         self.pdf.set_font("Helvetica", "", 11)
         
-        for i, finding in enumerate(findings[:10], 1):
-            severity = finding.get("severity", "MEDIUM")
-            category = self._sanitize_text(finding.get("category", "General"))
-            description = self._sanitize_text(finding.get("description", "")[:200])
-            
+        for i, (severity, category, description) in enumerate(self._sanitized["findings"], 1):
             self.pdf.set_font("Helvetica", "B", 11)
             self.pdf.cell(0, 7, f"{i}. [{severity}] {category}", ln=True)
             self.pdf.set_font("Helvetica", "", 10)
@@ -218,17 +261,12 @@ class PDFReportGenerator:
         self.pdf.cell(0, 10, "RECOMMENDATIONS", ln=True)
         self.pdf.ln(5)
         
-        report = results.get("report", {})
-        recommendations = report.get("recommendations", [])
-        next_steps = report.get("next_steps", [])
-        
         # Recommendations
         self.pdf.set_font("Helvetica", "B", 12)
         self.pdf.cell(0, 10, "Key Recommendations:", ln=True)
         self.pdf.set_font("Helvetica", "", 11)
         
-        for rec in recommendations[:8]:
-            action = self._sanitize_text(rec.get("action", "")[:150])
+        for action in self._sanitized["actions"]:
             if action.strip():
                 self.pdf.multi_cell(0, 6, f"  - {action}")
         
@@ -239,8 +277,7 @@ class PDFReportGenerator:
         self.pdf.cell(0, 10, "Next Steps:", ln=True)
         self.pdf.set_font("Helvetica", "", 11)
         
-        for step in next_steps:
-            sanitized_step = self._sanitize_text(step)
+        for sanitized_step in self._sanitized["next_steps"]:
             if sanitized_step.strip():
                 self.pdf.multi_cell(0, 6, sanitized_step)
     
@@ -277,5 +314,5 @@ recommend engaging qualified legal counsel.
         # Generation info
         self.pdf.ln(10)
         self.pdf.set_font("Helvetica", "I", 9)
-        self.pdf.cell(0, 6, f"Report generated on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}", ln=True)
+        self.pdf.cell(0, 6, f"Report generated on {self._generated_at.strftime('%Y-%m-%d %H:%M:%S')}", ln=True)
         self.pdf.cell(0, 6, "Contract Analysis & Risk Assessment Bot v1.0", ln=True)
@@ -2,18 +2,46 @@
 Audit Logger
 JSON-based audit trail logging for contract analyses
 """
+import heapq
+import io
 import json
+import mmap
 import os
 from datetime import datetime
+from itertools import count
 from pathlib import Path
-from typing import Dict, Optional
+from typing import BinaryIO, Dict, List, Optional
 import hashlib
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Per-process sequence appended to entry IDs
+_entry_counter = count()
+
+# Fixed parts of the plain-text audit trail export
+_EXPORT_HEADER = "AUDIT TRAIL EXPORT\n" + "=" * 50 + "\n"
+_EXPORT_ENTRY_FOOTER = "\n" + "-" * 30 + "\n"
+
+# Read size when hashing file objects on Pythons without hashlib.file_digest
+_HASH_CHUNK_SIZE = 1 << 20
+
+
+def _loads(data: bytes):
+    """Parse an audit file's UTF-8 JSON bytes"""
+    return orjson.loads(data) if ORJSON_AVAILABLE else json.loads(data)
+
 
 class AuditLogger:
     """Create and manage audit trails for contract analyses"""
     
-    def __init__(self, log_dir: str = None):
+    def __init__(self, log_dir: str = None, pretty: bool = False):
+        # Entries are written as compact JSON unless pretty-printing is asked for
+        self.pretty = pretty
+        
         if log_dir:
             self.log_dir = Path(log_dir)
         else:
@@ -40,12 +68,40 @@ class AuditLogger:
         Returns:
             Audit entry ID
         """
-        entry_id = self._generate_entry_id()
-        timestamp = datetime.now().isoformat()
+        entry = self._build_entry(file_name, file_hash, analysis_type, results, user_id)
+        self._write_entry(entry)
+        return entry["entry_id"]
+    
+    def create_audit_entries(self, entries: List[Dict]) -> List[str]:
+        """
+        Create several audit log entries at once
         
-        entry = {
-            "entry_id": entry_id,
-            "timestamp": timestamp,
+        Every entry is serialized before any file is written, then each
+        file is written with a single system call.
+        
+        Args:
+            entries: Dicts with the create_audit_entry arguments
+                (file_name, file_hash, analysis_type, results, user_id)
+            
+        Returns:
+            Audit entry IDs, in input order
+        """
+        built = [self._build_entry(**entry) for entry in entries]
+        payloads = [self._serialize(entry) for entry in built]
+        for entry, payload in zip(built, payloads):
+            self._write_bytes(self.log_dir / f"{entry['entry_id']}.json", payload)
+        return [entry["entry_id"] for entry in built]
+    
+    def _build_entry(self,
+                     file_name: str,
+                     file_hash: str,
+                     analysis_type: str,
+                     results: Dict,
+                     user_id: str = "anonymous") -> Dict:
+        """Assemble an audit entry with a fresh ID and timestamp"""
+        return {
+            "entry_id": self._generate_entry_id(),
+            "timestamp": datetime.now().isoformat(),
             "user_id": user_id,
             "file_info": {
                 "name": file_name,
@@ -55,18 +111,35 @@ class AuditLogger:
             "results_summary": self._summarize_results(results),
             "version": "1.0"
         }
-        
-        # Save entry
-        log_file = self.log_dir / f"{entry_id}.json"
-        with open(log_file, 'w', encoding='utf-8') as f:
-            json.dump(entry, f, indent=2, ensure_ascii=False)
-        
-        return entry_id
+    
+    def _serialize(self, entry: Dict) -> bytes:
+        """Encode an entry in the on-disk JSON form"""
+        if ORJSON_AVAILABLE:
+            return orjson.dumps(entry, option=orjson.OPT_INDENT_2 if self.pretty else None)
+        if self.pretty:
+            return json.dumps(entry, indent=2, ensure_ascii=False).encode("utf-8")
+        return json.dumps(entry, separators=(',', ':'), ensure_ascii=False).encode("utf-8")
+    
+    def _write_entry(self, entry: Dict):
+        """Save an entry to its own file"""
+        self._write_bytes(self.log_dir / f"{entry['entry_id']}.json", self._serialize(entry))
+    
+    @staticmethod
+    def _write_bytes(path: Path, data: bytes):
+        """Write a whole file with one write() on a raw descriptor"""
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view):]
+        finally:
+            os.close(fd)
     
     def _generate_entry_id(self) -> str:
         """Generate unique entry ID"""
+        # The counter keeps IDs made within one microsecond distinct and in order
         timestamp = datetime.now().strftime('%Y%m%d%H%M%S%f')
-        return f"AUDIT-{timestamp}"
+        return f"AUDIT-{timestamp}-{next(_entry_counter) % 1000000:06d}"
     
     def _summarize_results(self, results: Dict) -> Dict:
         """Create a summary of results for the audit log"""
@@ -96,23 +169,24 @@ class AuditLogger:
         log_file = self.log_dir / f"{entry_id}.json"
         
         if log_file.exists():
-            with open(log_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            with open(log_file, 'rb') as f:
+                return _loads(f.read())
         return None
     
     def get_recent_entries(self, limit: int = 10) -> list:
         """Get most recent audit entries"""
         entries = []
         
-        log_files = sorted(
-            self.log_dir.glob("AUDIT-*.json"),
-            key=lambda x: x.stat().st_mtime,
-            reverse=True
+        # Entry IDs start with their creation timestamp, so file names sort
+        # by age without a stat() per file; a heap keeps only the newest
+        log_files = heapq.nlargest(
+            limit,
+            (n for n in os.listdir(self.log_dir) if n.startswith("AUDIT-") and n.endswith(".json"))
         )
         
-        for log_file in log_files[:limit]:
-            with open(log_file, 'r', encoding='utf-8') as f:
-                entries.append(json.load(f))
+        for log_file in log_files:
+            with open(self.log_dir / log_file, 'rb') as f:
+                entries.append(_loads(f.read()))
         
         return entries
     
@@ -120,6 +194,25 @@ class AuditLogger:
         """Calculate SHA256 hash of file"""
         return hashlib.sha256(file_bytes).hexdigest()
     
+    def get_file_hash_path(self, file_path: str) -> str:
+        """Calculate SHA256 hash of a file on disk, memory-mapped rather than read"""
+        with open(file_path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                # Empty files cannot be mapped
+                return hashlib.sha256(b"").hexdigest()
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                return hashlib.sha256(mapped).hexdigest()
+    
+    def get_file_hash_stream(self, file_obj: BinaryIO) -> str:
+        """Calculate SHA256 hash of a binary file object without reading it all into memory"""
+        if hasattr(hashlib, "file_digest"):  # Python 3.11+
+            return hashlib.file_digest(file_obj, "sha256").hexdigest()
+        
+        digest = hashlib.sha256()
+        for chunk in iter(lambda: file_obj.read(_HASH_CHUNK_SIZE), b""):
+            digest.update(chunk)
+        return digest.hexdigest()
+    
     def export_audit_trail(self, entry_ids: list = None) -> str:
         """Export audit trail entries as a formatted report"""
         if entry_ids:
@@ -128,20 +221,22 @@ class AuditLogger:
         else:
             entries = self.get_recent_entries(limit=100)
         
-        lines = ["AUDIT TRAIL EXPORT", "=" * 50, ""]
+        buf = io.StringIO()
+        write = buf.write
+        write(_EXPORT_HEADER)
         
         for entry in entries:
-            lines.append(f"Entry ID: {entry.get('entry_id')}")
-            lines.append(f"Timestamp: {entry.get('timestamp')}")
-            lines.append(f"File: {entry.get('file_info', {}).get('name')}")
-            lines.append(f"Analysis: {entry.get('analysis_type')}")
+            get = entry.get
+            write(f"\nEntry ID: {get('entry_id')}"
+                  f"\nTimestamp: {get('timestamp')}"
+                  f"\nFile: {get('file_info', {}).get('name')}"
+                  f"\nAnalysis: {get('analysis_type')}")
             
-            summary = entry.get("results_summary", {})
+            summary = get("results_summary", {})
             if summary:
-                lines.append(f"Risk Score: {summary.get('risk_score', 'N/A')}")
-                lines.append(f"Risk Level: {summary.get('risk_level', 'N/A')}")
+                write(f"\nRisk Score: {summary.get('risk_score', 'N/A')}"
+                      f"\nRisk Level: {summary.get('risk_level', 'N/A')}")
             
-            lines.append("-" * 30)
-            lines.append("")
+            write(_EXPORT_ENTRY_FOOTER)
         
-        return "\n".join(lines)
+        return buf.getvalue()
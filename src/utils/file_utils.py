@@ -2,15 +2,19 @@
 File Utilities
 Helper functions for file handling
 """
+from functools import partial
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import BinaryIO, Callable, Optional, Tuple
 import os
 
+# Characters not allowed in stored file names, each mapped to '_'
+_UNSAFE_FILENAME_TABLE = str.maketrans('<>:"/\\|?*', '_' * 9)
+
 
 class FileUtils:
     """Utility functions for file operations"""
     
-    ALLOWED_EXTENSIONS = {'.pdf', '.docx', '.doc', '.txt'}
+    ALLOWED_EXTENSIONS = frozenset({'.pdf', '.docx', '.doc', '.txt'})
     MAX_FILE_SIZE_MB = 10
     
     @staticmethod
@@ -23,21 +27,49 @@ class FileUtils:
         Returns:
             Tuple of (is_valid, error_message)
         """
-        # Get extension
+        # Get extension; the size is only looked up once the type is accepted
         if file_path:
-            ext = Path(file_path).suffix.lower()
-            file_size = os.path.getsize(file_path)
-        elif file_name:
-            ext = Path(file_name).suffix.lower()
-            file_size = len(file_bytes) if file_bytes else 0
-        else:
+            return FileUtils._check(Path(file_path).suffix.lower(),
+                                    partial(os.path.getsize, file_path))
+        if file_name:
+            return FileUtils._check(Path(file_name).suffix.lower(),
+                                    partial(len, file_bytes or b""))
+        return False, "No file provided"
+    
+    @staticmethod
+    def validate_stream(file_obj: BinaryIO, file_name: str) -> Tuple[bool, str]:
+        """
+        Validate an open binary file without reading its contents
+        
+        The size comes from fstat() or, for in-memory streams, from seeking
+        to the end; the stream position is left unchanged.
+        
+        Returns:
+            Tuple of (is_valid, error_message)
+        """
+        if not file_name:
             return False, "No file provided"
         
+        def get_size() -> int:
+            try:
+                return os.fstat(file_obj.fileno()).st_size
+            except (AttributeError, OSError, ValueError):
+                position = file_obj.tell()
+                size = file_obj.seek(0, os.SEEK_END)
+                file_obj.seek(position)
+                return size
+        
+        return FileUtils._check(Path(file_name).suffix.lower(), get_size)
+    
+    @staticmethod
+    def _check(ext: str, get_size: Callable[[], int]) -> Tuple[bool, str]:
+        """Check extension first, then size"""
         # Check extension
         if ext not in FileUtils.ALLOWED_EXTENSIONS:
             return False, f"Unsupported file type: {ext}. Allowed: {', '.join(FileUtils.ALLOWED_EXTENSIONS)}"
         
         # Check size
+        file_size = get_size()
         size_mb = file_size / (1024 * 1024)
         if size_mb > FileUtils.MAX_FILE_SIZE_MB:
             return False, f"File too large: {size_mb:.2f} MB. Maximum: {FileUtils.MAX_FILE_SIZE_MB} MB"
@@ -52,6 +84,44 @@ class FileUtils:
                      file_bytes: bytes = None,
                      file_name: str = None) -> dict:
         """Get basic file information"""
+        return FileUtils._probe(file_path, file_bytes, file_name)
+    
+    @staticmethod
+    def inspect_file(file_path: str = None,
+                     file_bytes: bytes = None,
+                     file_name: str = None) -> Tuple[bool, str, dict]:
+        """
+        Validate a file and get its information from a single probe
+        
+        Callers needing both results pay one stat() instead of one per call.
+        The extension is checked before the path is stat()ed, and a path that
+        cannot be stat()ed is reported as invalid rather than raising.
+        
+        Returns:
+            Tuple of (is_valid, error_message, file_info)
+        """
+        if not (file_path or file_name):
+            return False, "No file provided", FileUtils._probe()
+        
+        # A path gets only its name and extension here; it is stat()ed once
+        # the extension is accepted
+        info = FileUtils._probe(file_bytes=None if file_path else file_bytes,
+                                file_name=file_path or file_name)
+        if file_path and info["extension"] in FileUtils.ALLOWED_EXTENSIONS:
+            try:
+                info["size_bytes"] = os.stat(file_path).st_size
+            except OSError as e:
+                return False, f"Cannot read file: {e.strerror or e}", info
+            info["size_mb"] = round(info["size_bytes"] / (1024 * 1024), 2)
+        
+        is_valid, error = FileUtils._check(info["extension"], partial(info.get, "size_bytes"))
+        return is_valid, error, info
+    
+    @staticmethod
+    def _probe(file_path: str = None,
+               file_bytes: bytes = None,
+               file_name: str = None) -> dict:
+        """Name, extension and size of a file path or in-memory file"""
         info = {
             "name": "",
             "extension": "",
@@ -63,7 +133,7 @@ class FileUtils:
             path = Path(file_path)
             info["name"] = path.name
             info["extension"] = path.suffix.lower()
-            info["size_bytes"] = os.path.getsize(file_path)
+            info["size_bytes"] = os.stat(file_path).st_size
         elif file_name:
             path = Path(file_name)
             info["name"] = path.name
@@ -77,9 +147,5 @@ class FileUtils:
     @staticmethod
     def get_safe_filename(filename: str) -> str:
         """Sanitize filename for safe storage"""
-        # Remove or replace unsafe characters
-        unsafe_chars = '<>:"/\\|?*'
-        safe_name = filename
-        for char in unsafe_chars:
-            safe_name = safe_name.replace(char, '_')
-        return safe_name
+        # Replace unsafe characters in one pass
+        return filename.translate(_UNSAFE_FILENAME_TABLE)
@@ -2,8 +2,41 @@
 Text Utilities
 Helper functions for text processing
 """
+import functools
 import re
-from typing import List
+from typing import Dict, List, Tuple
+
+# Whitespace runs collapsed by clean_text
+_WHITESPACE_RE = re.compile(r'\s+')
+
+# Abbreviations whose trailing period does not end a sentence
+_ABBREVIATIONS = ("Mr", "Mrs", "Ms", "Dr", "Ltd", "Pvt", "Inc", "Corp", "vs", "etc")
+
+# Whitespace after sentence-ending punctuation, unless the period closes an
+# abbreviation; one fixed-width lookbehind per abbreviation
+_SENTENCE_BREAK_RE = re.compile(
+    r'(?<=[.!?])'
+    + ''.join(rf'(?<!\b{abbr}\.)' for abbr in _ABBREVIATIONS)
+    + r'\s+'
+)
+
+
+@functools.lru_cache(maxsize=64)
+def _keyword_pattern(keywords: Tuple[str, ...]) -> Tuple[re.Pattern, Dict[str, str]]:
+    """
+    Compile keywords into one case-insensitive alternation
+    
+    Longer keywords are tried first, so a keyword inside a longer one
+    does not split its highlight. The matching group name maps back to
+    the keyword as given.
+    """
+    ordered = sorted(dict.fromkeys(k for k in keywords if k), key=len, reverse=True)
+    group_keywords = {f"k{i}": keyword for i, keyword in enumerate(ordered)}
+    pattern = re.compile(
+        "|".join(f"(?P<{name}>{re.escape(keyword)})" for name, keyword in group_keywords.items()),
+        re.IGNORECASE
+    )
+    return pattern, group_keywords
 
 
 class TextUtils:
@@ -16,27 +49,19 @@ class TextUtils:
             return ""
         
         # Remove excessive whitespace
-        text = re.sub(r'\s+', ' ', text)
+        text = _WHITESPACE_RE.sub(' ', text)
         
-        # Remove non-printable characters
-        text = ''.join(char for char in text if char.isprintable() or char in '\n\t')
+        # Remove non-printable characters; isprintable() scans in C, so the
+        # per-character filter only runs on text that actually has some
+        if not text.isprintable():
+            text = ''.join(char for char in text if char.isprintable() or char in '\n\t')
         
         return text.strip()
     
     @staticmethod
     def split_into_sentences(text: str) -> List[str]:
         """Split text into sentences"""
-        # Handle common abbreviations
-        text = re.sub(r'\b(Mr|Mrs|Ms|Dr|Ltd|Pvt|Inc|Corp|vs|etc)\.\s', r'\1<DOT> ', text)
-        
-        # Split on sentence boundaries
-        sentences = re.split(r'(?<=[.!?])\s+', text)
-        
-        # Restore periods
-        sentences = [s.replace('<DOT>', '.') for s in sentences]
-        
-        # Filter empty sentences
-        return [s.strip() for s in sentences if s.strip()]
+        return [s.strip() for s in _SENTENCE_BREAK_RE.split(text) if s.strip()]
     
     @staticmethod
     def get_word_count(text: str) -> int:
@@ -57,21 +82,26 @@ class TextUtils:
     def highlight_keywords(text: str, keywords: List[str], 
                           before: str = "**", after: str = "**") -> str:
         """Highlight keywords in text"""
-        result = text
-        for keyword in keywords:
-            pattern = re.compile(re.escape(keyword), re.IGNORECASE)
-            result = pattern.sub(f"{before}{keyword}{after}", result)
-        return result
+        keywords = tuple(keywords)
+        if not any(keywords):
+            return text
+        
+        pattern, group_keywords = _keyword_pattern(keywords)
+        return pattern.sub(
+            lambda m: f"{before}{group_keywords[m.lastgroup]}{after}", text
+        )
     
     @staticmethod
     def extract_section(text: str, start_marker: str, end_marker: str = None) -> str:
         """Extract a section of text between markers"""
-        start_idx = text.lower().find(start_marker.lower())
+        # Lowercase once; both searches run on the same copy
+        text_lower = text.lower()
+        start_idx = text_lower.find(start_marker.lower())
         if start_idx == -1:
             return ""
         
         if end_marker:
-            end_idx = text.lower().find(end_marker.lower(), start_idx + len(start_marker))
+            end_idx = text_lower.find(end_marker.lower(), start_idx + len(start_marker))
             if end_idx == -1:
                 return text[start_idx:]
             return text[start_idx:end_idx]
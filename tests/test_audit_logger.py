@@ -0,0 +1,77 @@
+"""
+Audit Logger tests
+Batch entry creation and file hashing
+"""
+import hashlib
+import io
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.utils.audit_logger import AuditLogger
+
+RESULTS = {"risk_score": {"composite_score": 4.2, "risk_level": "medium"}}
+
+
+class TestAuditLogger(unittest.TestCase):
+    """Batch writes and the path and stream hash helpers"""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.logger = AuditLogger(log_dir=self.tmp.name)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_create_audit_entries(self):
+        batch = [
+            {"file_name": f"contract{i}.pdf", "file_hash": f"h{i}",
+             "analysis_type": "full_analysis", "results": RESULTS}
+            for i in range(3)
+        ]
+        ids = self.logger.create_audit_entries(batch)
+        self.assertEqual(len(set(ids)), 3)
+        for i, entry_id in enumerate(ids):
+            entry = self.logger.get_audit_entry(entry_id)
+            self.assertEqual(entry["file_info"], {"name": f"contract{i}.pdf", "hash": f"h{i}"})
+        self.assertEqual(self.logger.create_audit_entries([]), [])
+
+    def test_batch_matches_single_entry(self):
+        single_id = self.logger.create_audit_entry("a.pdf", "h", "full_analysis", RESULTS)
+        [batch_id] = self.logger.create_audit_entries([{
+            "file_name": "a.pdf", "file_hash": "h",
+            "analysis_type": "full_analysis", "results": RESULTS,
+        }])
+        single = self.logger.get_audit_entry(single_id)
+        batch = self.logger.get_audit_entry(batch_id)
+        for entry in (single, batch):
+            entry.pop("entry_id")
+            entry.pop("timestamp")
+        self.assertEqual(single, batch)
+
+    def test_hash_helpers_agree(self):
+        data = os.urandom(3 * 1024 * 1024 + 17)
+        path = os.path.join(self.tmp.name, "contract.bin")
+        with open(path, "wb") as f:
+            f.write(data)
+        expected = hashlib.sha256(data).hexdigest()
+        self.assertEqual(self.logger.get_file_hash(data), expected)
+        self.assertEqual(self.logger.get_file_hash_path(path), expected)
+        self.assertEqual(self.logger.get_file_hash_stream(io.BytesIO(data)), expected)
+        with open(path, "rb") as f:
+            self.assertEqual(self.logger.get_file_hash_stream(f), expected)
+
+    def test_hash_empty_file(self):
+        path = os.path.join(self.tmp.name, "empty.txt")
+        open(path, "wb").close()
+        expected = hashlib.sha256(b"").hexdigest()
+        self.assertEqual(self.logger.get_file_hash_path(path), expected)
+        self.assertEqual(self.logger.get_file_hash_stream(io.BytesIO()), expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
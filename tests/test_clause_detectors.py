@@ -0,0 +1,80 @@
+"""
+Clause Detectors tests
+Termination detection and the detect_all result cache
+"""
+import sys
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.risk_engine import clause_detectors
+from src.risk_engine.clause_detectors import ClauseDetectors
+
+SAMPLE_CONTRACT = Path(__file__).parent / "samples" / "sample_employment_agreement.txt"
+
+
+class TestTerminationDetection(unittest.TestCase):
+    """Overlapping termination patterns are all found"""
+
+    def setUp(self):
+        self.detectors = ClauseDetectors()
+
+    def test_greedy_for_cause_does_not_hide_unilateral(self):
+        result = self.detectors.detect_termination_clauses(
+            "After a material breach the Company may terminate for cause. "
+            "Also the employer may terminate without notice."
+        )
+        self.assertTrue(result["has_unilateral_termination"])
+        self.assertFalse(result["is_balanced"])
+        self.assertIsNotNone(result["recommendation"])
+
+    def test_mutual_and_unilateral_overlap(self):
+        result = self.detectors.detect_termination_clauses(
+            "Either party may terminate immediately upon written notice."
+        )
+        self.assertEqual(len(result["findings"]["mutual"]), 1)
+        self.assertEqual(len(result["findings"]["unilateral"]), 1)
+
+
+class TestDetectAllCache(unittest.TestCase):
+    """Cached detect_all results are private copies and can be invalidated"""
+
+    def setUp(self):
+        self.detectors = ClauseDetectors()
+        self.text = SAMPLE_CONTRACT.read_text(encoding="utf-8")
+
+    def test_mutating_a_miss_does_not_touch_the_cache(self):
+        first = self.detectors.detect_all(self.text)
+        expected = repr(first)
+        first["penalty_clauses"]["findings"].append({"text": "x"})
+        first.clear()
+        self.assertEqual(repr(self.detectors.detect_all(self.text)), expected)
+
+    def test_mutating_a_hit_does_not_touch_the_cache(self):
+        self.detectors.detect_all(self.text)
+        hit = self.detectors.detect_all(self.text)
+        expected = repr(hit)
+        hit["termination_clauses"]["findings"]["unilateral"].append({"text": "x"})
+        self.assertEqual(repr(self.detectors.detect_all(self.text)), expected)
+
+    def test_clear_cache(self):
+        self.detectors.detect_all(self.text)
+        self.assertEqual(len(self.detectors._cache), 1)
+        self.detectors.clear_cache()
+        self.assertEqual(len(self.detectors._cache), 0)
+
+    def test_oldest_entry_is_evicted(self):
+        with mock.patch.object(clause_detectors, "_CACHE_SIZE", 2):
+            for text in ("first text", "second text", "third text"):
+                self.detectors.detect_all(text)
+        self.assertEqual(len(self.detectors._cache), 2)
+        self.assertEqual(
+            self.detectors.detect_all("first text"),
+            ClauseDetectors().detect_all("first text")
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,111 @@
+"""
+Compliance Checker tests
+Regex backend selection, RE2 parity and the result cache
+"""
+import re
+import sys
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.risk_engine import compliance_checker
+from src.risk_engine.compliance_checker import ComplianceChecker, RE2_AVAILABLE
+
+SAMPLE_CONTRACT = Path(__file__).parent / "samples" / "sample_employment_agreement.txt"
+
+# Lease text with a non-breaking space inside "stamp duty"
+NBSP_LEASE = (
+    "This lease between the Lessor and the Tenant is for 24 months at a rent "
+    "of Rs. 20,000 per month. The Tenant shall pay the stamp\u00a0duty and the "
+    "lease shall be registered with the sub-registrar. Disputes go to the "
+    "courts at Mumbai under the Arbitration and Conciliation Act."
+)
+
+
+def _pattern_sources():
+    """Every compiled compliance pattern source"""
+    columns = (
+        compliance_checker._BASIC_COLUMNS, compliance_checker._EMPLOYMENT_COLUMNS,
+        compliance_checker._LEASE_COLUMNS, compliance_checker._GENERAL_COLUMNS,
+    )
+    return sorted({
+        pattern.pattern
+        for section in columns
+        for patterns in section.patterns
+        for pattern in patterns
+    })
+
+
+class TestRegexBackend(unittest.TestCase):
+    """RE2 is opt-in and agrees with the stdlib engine on ASCII text"""
+
+    def test_stdlib_is_default(self):
+        if not compliance_checker.USE_RE2:
+            self.assertIs(compliance_checker._RE, re)
+
+    def test_nbsp_whitespace_matches(self):
+        if compliance_checker.USE_RE2:
+            self.skipTest("RE2 backend enabled; its \\s is ASCII-only")
+        result = ComplianceChecker().check_compliance(NBSP_LEASE, "lease_agreement")
+        self.assertTrue(result["lease_compliance"]["stamp_duty"]["found"])
+
+    @unittest.skipUnless(RE2_AVAILABLE, "re2 is not installed")
+    def test_re2_parity_on_sample(self):
+        import re2
+        text = SAMPLE_CONTRACT.read_text(encoding="utf-8").lower()
+        for source in _pattern_sources():
+            with self.subTest(pattern=source):
+                expected = [m.group() for m in re.finditer(source, text)]
+                actual = [m.group() for m in re2.compile(source).finditer(text)]
+                self.assertEqual(actual, expected)
+
+
+class TestComplianceCache(unittest.TestCase):
+    """Cached results are private copies, keyed by text and contract type"""
+
+    def setUp(self):
+        self.checker = ComplianceChecker()
+        self.text = SAMPLE_CONTRACT.read_text(encoding="utf-8")
+
+    def test_mutating_results_does_not_touch_the_cache(self):
+        miss = self.checker.check_compliance(self.text, "employment_agreement")
+        expected = repr(miss)
+        miss["issues"].append("x")
+        miss.clear()
+        hit = self.checker.check_compliance(self.text, "employment_agreement")
+        self.assertEqual(repr(hit), expected)
+        hit["basic_requirements"].clear()
+        self.assertEqual(
+            repr(self.checker.check_compliance(self.text, "employment_agreement")), expected
+        )
+
+    def test_contract_type_is_part_of_the_key(self):
+        self.checker.check_compliance(self.text, "employment_agreement")
+        lease = self.checker.check_compliance(self.text, "lease_agreement")
+        self.assertIn("lease_compliance", lease)
+        self.assertNotIn("employment_compliance", lease)
+
+    def test_no_cache_bypasses_the_cache(self):
+        result = self.checker.check_compliance(self.text, no_cache=True)
+        self.assertEqual(len(self.checker._cache), 0)
+        self.assertEqual(result, self.checker.check_compliance(self.text))
+
+    def test_clear_cache_and_eviction(self):
+        with mock.patch.object(compliance_checker, "_CACHE_SIZE", 2):
+            for contract_type in ("general", "nda", "lease_agreement"):
+                self.checker.check_compliance(self.text, contract_type)
+        self.assertEqual(len(self.checker._cache), 2)
+        self.checker.clear_cache()
+        self.assertEqual(len(self.checker._cache), 0)
+
+    def test_configs_are_read_only(self):
+        with self.assertRaises(TypeError):
+            ComplianceChecker.basic_requirements["extra"] = {}
+        with self.assertRaises(TypeError):
+            ComplianceChecker.lease_compliance["stamp_duty"]["patterns"][0] = "x"
+
+
+if __name__ == "__main__":
+    unittest.main()
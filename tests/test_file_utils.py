@@ -0,0 +1,81 @@
+"""
+File Utilities tests
+Stream validation and combined inspection
+"""
+import io
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.utils.file_utils import FileUtils
+
+SAMPLE_CONTRACT = Path(__file__).parent / "samples" / "sample_employment_agreement.txt"
+
+
+class TestValidateStream(unittest.TestCase):
+    """validate_stream agrees with validate_file and keeps the position"""
+
+    def test_in_memory_stream(self):
+        stream = io.BytesIO(b"contract text")
+        stream.seek(3)
+        self.assertEqual(FileUtils.validate_stream(stream, "a.txt"), (True, ""))
+        self.assertEqual(stream.tell(), 3)
+
+    def test_real_file(self):
+        with open(SAMPLE_CONTRACT, "rb") as f:
+            self.assertEqual(
+                FileUtils.validate_stream(f, SAMPLE_CONTRACT.name),
+                FileUtils.validate_file(file_path=str(SAMPLE_CONTRACT))
+            )
+
+    def test_empty_and_unsupported(self):
+        self.assertEqual(FileUtils.validate_stream(io.BytesIO(), "a.pdf"), (False, "File is empty"))
+        is_valid, error = FileUtils.validate_stream(io.BytesIO(b"x"), "a.exe")
+        self.assertFalse(is_valid)
+        self.assertIn("Unsupported file type", error)
+        self.assertEqual(FileUtils.validate_stream(io.BytesIO(b"x"), ""), (False, "No file provided"))
+
+    def test_too_large(self):
+        size = (FileUtils.MAX_FILE_SIZE_MB + 1) * 1024 * 1024
+        is_valid, error = FileUtils.validate_stream(io.BytesIO(b"\0" * size), "a.pdf")
+        self.assertFalse(is_valid)
+        self.assertIn("File too large", error)
+
+
+class TestInspectFile(unittest.TestCase):
+    """inspect_file matches validate_file and get_file_info"""
+
+    def test_path_matches_separate_calls(self):
+        path = str(SAMPLE_CONTRACT)
+        is_valid, error, info = FileUtils.inspect_file(file_path=path)
+        self.assertEqual((is_valid, error), FileUtils.validate_file(file_path=path))
+        self.assertEqual(info, FileUtils.get_file_info(file_path=path))
+
+    def test_bytes_match_separate_calls(self):
+        kwargs = {"file_bytes": b"contract", "file_name": "Deal.PDF"}
+        is_valid, error, info = FileUtils.inspect_file(**kwargs)
+        self.assertEqual((is_valid, error), FileUtils.validate_file(**kwargs))
+        self.assertEqual(info, FileUtils.get_file_info(**kwargs))
+
+    def test_unsupported_missing_path_is_not_stat_ed(self):
+        is_valid, error, info = FileUtils.inspect_file(file_path="/no/such/file.exe")
+        self.assertFalse(is_valid)
+        self.assertIn("Unsupported file type", error)
+        self.assertEqual(info["name"], "file.exe")
+
+    def test_missing_supported_path_is_a_validation_error(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            is_valid, error, _ = FileUtils.inspect_file(file_path=os.path.join(tmp, "gone.pdf"))
+        self.assertFalse(is_valid)
+        self.assertTrue(error.startswith("Cannot read file"))
+
+    def test_no_file(self):
+        self.assertEqual(FileUtils.inspect_file()[:2], (False, "No file provided"))
+
+
+if __name__ == "__main__":
+    unittest.main()
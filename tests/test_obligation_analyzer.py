@@ -0,0 +1,55 @@
+"""
+Obligation Analyzer tests
+The analyze result cache
+"""
+import sys
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.nlp_engine import obligation_analyzer
+from src.nlp_engine.obligation_analyzer import ObligationAnalyzer
+
+SAMPLE_CONTRACT = Path(__file__).parent / "samples" / "sample_employment_agreement.txt"
+
+
+class TestAnalyzeCache(unittest.TestCase):
+    """Cached analyze results are private copies and can be invalidated"""
+
+    def setUp(self):
+        self.analyzer = ObligationAnalyzer()
+        self.text = SAMPLE_CONTRACT.read_text(encoding="utf-8")
+
+    def test_cached_result_matches_fresh_analysis(self):
+        self.analyzer.analyze(self.text)
+        self.assertEqual(
+            self.analyzer.analyze(self.text),
+            ObligationAnalyzer().analyze(self.text)
+        )
+
+    def test_mutating_results_does_not_touch_the_cache(self):
+        miss = self.analyzer.analyze(self.text)
+        expected = repr(miss)
+        miss["obligations"].clear()
+        miss["summary"]["total_obligations"] = -1
+        hit = self.analyzer.analyze(self.text)
+        self.assertEqual(repr(hit), expected)
+        hit["rights"].append({"text": "x"})
+        self.assertEqual(repr(self.analyzer.analyze(self.text)), expected)
+
+    def test_clear_cache(self):
+        self.analyzer.analyze(self.text)
+        self.analyzer.clear_cache()
+        self.assertEqual(len(self.analyzer._cache), 0)
+
+    def test_oldest_entry_is_evicted(self):
+        with mock.patch.object(obligation_analyzer, "_CACHE_SIZE", 2):
+            for text in ("The Employee shall work.", "The Company may pay.", "Nobody must not."):
+                self.analyzer.analyze(text)
+        self.assertEqual(len(self.analyzer._cache), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
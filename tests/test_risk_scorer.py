@@ -0,0 +1,147 @@
+"""
+Risk Scorer regression tests
+Scores must match those of the original one-regex-per-pattern scorer
+"""
+import copy
+import sys
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.risk_engine import risk_scorer
+from src.risk_engine.risk_scorer import RiskScorer
+
+SAMPLE_CONTRACT = Path(__file__).parent / "samples" / "sample_employment_agreement.txt"
+
+# Clauses whose indicators overlap or repeat
+RISKY_CLAUSES = [
+    "The license is perpetual and irrevocable and unconditional.",
+    "The Vendor shall indemnify the Client against all claims and waive all rights to appeal. Unlimited liability applies.",
+    "Liquidated damages and a penalty of Rs. 50,000 apply. The Company may terminate immediately. Automatic renewal applies.",
+    "Payment within 90 days of invoice, net 90. An early termination penalty and termination fee apply.",
+    "The parties shall use reasonable efforts and act in good faith. Governing law is India; force majeure applies.",
+    "Forfeit, forfeit, forfeit, forfeit, forfeit, forfeit and forfeiture of the deposit.",
+]
+
+# (score, risk level) of each clause in RISKY_CLAUSES, from the original scorer
+BASELINE_RISKY_SCORES = [
+    (6.0, "medium"),
+    (9.0, "high"),
+    (8.0, "high"),
+    (6.0, "medium"),
+    (3.0, "low"),
+    (10.0, "high"),
+]
+
+
+def _load_clauses():
+    """Split the sample contract into paragraphs and append the risky clauses"""
+    text = SAMPLE_CONTRACT.read_text(encoding="utf-8")
+    paragraphs = [p for p in text.split("\n\n") if p.strip()]
+    return [{"text": p} for p in paragraphs + RISKY_CLAUSES]
+
+
+class TestRiskScorerBaseline(unittest.TestCase):
+    """Compare RiskScorer output against the original scorer's results"""
+
+    def setUp(self):
+        self.scorer = RiskScorer()
+
+    def test_overlapping_indicators_all_count(self):
+        result = self.scorer.score_clause(RISKY_CLAUSES[0])
+        self.assertEqual(result["score"], 6.0)
+        self.assertEqual(result["risk_level"], "medium")
+        self.assertTrue(result["requires_attention"])
+        self.assertEqual(
+            sorted(f["pattern"] for f in result["findings"]),
+            ["irrevocable and unconditional", "perpetual and irrevocable"]
+        )
+
+    def test_findings_list_is_capped(self):
+        result = self.scorer.score_clause(RISKY_CLAUSES[-1])
+        self.assertEqual(result["score"], 10.0)
+        self.assertEqual(len(result["findings"]), 5)
+
+    def test_findings_limit(self):
+        clause = RISKY_CLAUSES[1]
+        full = self.scorer.score_clause(clause)
+        limited = self.scorer.score_clause(clause, findings_limit=2)
+        self.assertEqual(limited["score"], full["score"])
+        self.assertEqual(limited["risk_level"], full["risk_level"])
+        self.assertEqual(limited["findings"], full["findings"][:2])
+        self.assertEqual(self.scorer.score_clause(clause, findings_limit=0)["findings"], [])
+        # Matching stops early once the score is capped; the score is unaffected
+        saturated = self.scorer.score_clause(RISKY_CLAUSES[-1], findings_limit=2)
+        self.assertEqual(saturated["score"], 10.0)
+        self.assertEqual(len(saturated["findings"]), 2)
+
+    def test_cached_result_is_not_shared(self):
+        clause = "Payment within 90 days. The parties act in good faith."
+        first = self.scorer.score_clause(clause)
+        expected = copy.deepcopy(first)
+        first["findings"].append({"pattern": "x", "severity": "low", "weight": 0.5})
+        first["findings"][0]["severity"] = "critical"
+        first["sme_concerns"].clear()
+        first["score"] = 0.0
+        self.assertEqual(self.scorer.score_clause(clause), expected)
+
+    def test_clear_cache_and_eviction(self):
+        with mock.patch.object(risk_scorer, "_CLAUSE_CACHE_SIZE", 2):
+            for clause in RISKY_CLAUSES[:3]:
+                self.scorer.score_clause(clause)
+        self.assertEqual(len(self.scorer._clause_cache), 2)
+        self.assertEqual(
+            self.scorer.score_clause(RISKY_CLAUSES[0]),
+            RiskScorer().score_clause(RISKY_CLAUSES[0])
+        )
+        self.scorer.clear_cache()
+        self.assertEqual(len(self.scorer._clause_cache), 0)
+
+    def test_clause_scores(self):
+        scores = [
+            (r["score"], r["risk_level"])
+            for r in map(self.scorer.score_clause, RISKY_CLAUSES)
+        ]
+        self.assertEqual(scores, BASELINE_RISKY_SCORES)
+
+    def test_sample_contract(self):
+        result = self.scorer.score_contract(_load_clauses())
+        self.assertEqual(result["composite_score"], 6.3)
+        self.assertEqual(result["risk_level"], "high")
+        self.assertEqual(result["critical_clauses_count"], 3)
+        self.assertEqual(result["high_risk_clauses_count"], 2)
+        self.assertEqual(result["total_findings"], 23)
+        self.assertEqual(
+            result["severity_distribution"],
+            {"critical": 6, "high": 12, "medium": 2, "low": 3}
+        )
+        self.assertEqual(
+            [(c["score"], c["risk_level"]) for c in result["clause_scores"] if c["score"]],
+            [(3.0, "low"), (2.0, "low"), (0.5, "low")] + BASELINE_RISKY_SCORES
+        )
+
+    def test_streaming_matches_score_contract(self):
+        clauses = _load_clauses()
+        run = self.scorer.iter_score_contract(iter(clauses))
+        streamed = self.scorer.finalize(run, list(run))
+        self.assertEqual(streamed, self.scorer.score_contract(clauses))
+
+    def test_interleaved_runs_keep_separate_totals(self):
+        risky = [{"text": text} for text in RISKY_CLAUSES]
+        plain = [{"text": "The term is one year."}] * 3
+        run_a = self.scorer.iter_score_contract(risky)
+        run_b = self.scorer.iter_score_contract(plain)
+        entries_a, entries_b = iter(run_a), iter(run_b)
+        kept_a, kept_b = [], []
+        for _ in plain:
+            kept_a.append(next(entries_a))
+            kept_b.append(next(entries_b))
+        kept_a.extend(entries_a)
+        self.assertEqual(self.scorer.finalize(run_a, kept_a), self.scorer.score_contract(risky))
+        self.assertEqual(self.scorer.finalize(run_b, kept_b), self.scorer.score_contract(plain))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,41 @@
+"""
+Text Utilities tests
+Keyword highlighting
+"""
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.utils.text_utils import TextUtils
+
+
+class TestHighlightKeywords(unittest.TestCase):
+    """Keywords are highlighted once each, longest first"""
+
+    def test_overlapping_keywords_highlight_once(self):
+        self.assertEqual(
+            TextUtils.highlight_keywords("The tenant shall not sublet.", ["shall", "shall not"]),
+            "The tenant **shall not** sublet."
+        )
+
+    def test_case_insensitive_and_keyword_as_given(self):
+        self.assertEqual(
+            TextUtils.highlight_keywords("SHALL pay and Shall sign", ["shall"]),
+            "**shall** pay and **shall** sign"
+        )
+
+    def test_custom_markers_and_regex_characters(self):
+        self.assertEqual(
+            TextUtils.highlight_keywords("Fee is Rs. 500 (net)", ["rs.", "(net)"], "<b>", "</b>"),
+            "Fee is <b>rs.</b> 500 <b>(net)</b>"
+        )
+
+    def test_empty_keywords(self):
+        self.assertEqual(TextUtils.highlight_keywords("text", []), "text")
+        self.assertEqual(TextUtils.highlight_keywords("text", [""]), "text")
+
+
+if __name__ == "__main__":
+    unittest.main()